@@ -1,5 +1,9 @@
+import os
+
 from flask import Flask
 from flask_migrate import Migrate
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
 from config import Config
 from models import db
 from services.elo_service import recalculate_all_elo_ratings
@@ -15,6 +19,32 @@ def create_app():
     db.init_app(app)
     migrate = Migrate(app, db)
 
+    # Persist compiled templates on disk so fresh processes (and other
+    # gunicorn workers) reuse them instead of re-parsing every partial.
+    # The directory lives under the instance path by default and is
+    # created owner-only: Jinja loads these files with marshal, so a
+    # predictable world-readable location would let any local user plant
+    # bytecode that runs in the app process
+    cache_dir = app.config["JINJA_BYTECODE_CACHE_DIR"] or os.path.join(
+        app.instance_path, "jinja_cache"
+    )
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+    # SQLite defaults to a rollback journal, where every write blocks all
+    # readers and every commit pays a full fsync. WAL lets the read-heavy
+    # htmx endpoints keep serving during writes, and synchronous=NORMAL is
+    # durable enough in WAL mode at roughly half the fsync cost
+    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+        with app.app_context():
+            @event.listens_for(db.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
+
     # Register blueprints
     from blueprints.pages import pages_bp
     from blueprints.players import players_bp
@@ -2,29 +2,49 @@
 
 from flask import Blueprint, render_template, request
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 from dateutil.parser import parse
 from datetime import datetime, timedelta
 from models import db, Player, Game, GamePlayer, CakeBalance, TournamentMatch, GameAuditLog
 from services.elo_service import update_elo_ratings
 from services.game_service import update_cake_balance, create_game_audit_entry
+from services.background_service import run_in_background
 from services.leaderboard_service import create_daily_snapshot
-from services.recalculation_service import recalculate_all_derived_data
+from services.recalculation_service import recalculate_all_derived_data_for_seasons
 from services.season_service import get_season_for_date, get_current_season
 
 games_bp = Blueprint("games", __name__)
 
 
+def _get_tournament_game_ids():
+    """Return the set of game IDs linked to tournament matches.
+
+    Selects only the game_id column instead of hydrating full
+    TournamentMatch objects.
+    """
+    return {
+        game_id
+        for (game_id,) in db.session.query(TournamentMatch.game_id)
+        .filter(TournamentMatch.game_id.isnot(None))
+        .all()
+    }
+
+
 @games_bp.route("/games", methods=["GET"])
 def get_games():
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 20, type=int)
 
-    pagination = Game.query.order_by(Game.start_time.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    # Eager-load the players rendered in each row so the template doesn't
+    # trigger a lazy SELECT per game
+    pagination = (
+        Game.query.options(selectinload(Game.players).selectinload(GamePlayer.player))
+        .order_by(Game.start_time.desc())
+        .paginate(page=page, per_page=per_page, error_out=False)
     )
 
     # Get IDs of games that are linked to tournaments (cannot be edited)
-    tournament_game_ids = {match.game_id for match in TournamentMatch.query.filter(TournamentMatch.game_id.isnot(None)).all()}
+    tournament_game_ids = _get_tournament_game_ids()
 
     return render_template(
         "partials/games_list.html",
@@ -85,40 +105,35 @@ def add_game():
         db.session.add(game)
         db.session.flush()  # Get the game ID
 
-        # Add players to teams
-        team1_players = request.form.getlist("team1_players")
-        team2_players = request.form.getlist("team2_players")
+        # Add players to teams; type=int drops empty selections during parsing
+        team1_ids = request.form.getlist("team1_players", type=int)
+        team2_ids = request.form.getlist("team2_players", type=int)
 
         # Validate that no player appears on both teams
-        team1_ids = [int(p) for p in team1_players if p]
-        team2_ids = [int(p) for p in team2_players if p]
-
-        duplicate_players = set(team1_ids) & set(team2_ids)
-        if duplicate_players:
+        team2_id_set = frozenset(team2_ids)
+        if any(pid in team2_id_set for pid in team1_ids):
             return '<div class="alert alert-danger">A player cannot play against themselves!</div>', 200
 
         # Determine winners
         team1_wins = team1_score > team2_score
 
-        for player_id in team1_players:
-            if player_id:
-                game_player = GamePlayer(
-                    game_id=game.id,
-                    player_id=int(player_id),
-                    team=1,
-                    is_winner=team1_wins,
-                )
-                db.session.add(game_player)
-
-        for player_id in team2_players:
-            if player_id:
-                game_player = GamePlayer(
-                    game_id=game.id,
-                    player_id=int(player_id),
-                    team=2,
-                    is_winner=not team1_wins,
-                )
-                db.session.add(game_player)
+        for player_id in team1_ids:
+            game_player = GamePlayer(
+                game_id=game.id,
+                player_id=player_id,
+                team=1,
+                is_winner=team1_wins,
+            )
+            db.session.add(game_player)
+
+        for player_id in team2_ids:
+            game_player = GamePlayer(
+                game_id=game.id,
+                player_id=player_id,
+                team=2,
+                is_winner=not team1_wins,
+            )
+            db.session.add(game_player)
 
         # Handle cake counter for shutouts
         if game.is_shutout:
@@ -129,12 +144,9 @@ def add_game():
 
         db.session.commit()
 
-        # Create daily snapshot for the game's season after committing the game
-        try:
-            create_daily_snapshot(season_id=game.season_id)
-        except Exception as snapshot_error:
-            # Log error but don't fail the game creation
-            print(f"Warning: Failed to create daily snapshot: {snapshot_error}")
+        # Create daily snapshot for the game's season in the background so the
+        # response doesn't wait for the leaderboard walk
+        run_in_background(create_daily_snapshot, season_id=game.season_id)
 
         return '<div class="alert alert-success">Game recorded successfully!</div>', 201
 
@@ -282,16 +294,13 @@ def update_game(game_id):
                 200,
             )
 
-        # Get player lists
-        team1_players = request.form.getlist("team1_players")
-        team2_players = request.form.getlist("team2_players")
+        # Get player lists; type=int drops empty selections during parsing
+        team1_ids = request.form.getlist("team1_players", type=int)
+        team2_ids = request.form.getlist("team2_players", type=int)
 
         # Validate that no player appears on both teams
-        team1_ids = [int(p) for p in team1_players if p]
-        team2_ids = [int(p) for p in team2_players if p]
-
-        duplicate_players = set(team1_ids) & set(team2_ids)
-        if duplicate_players:
+        team2_id_set = frozenset(team2_ids)
+        if any(pid in team2_id_set for pid in team1_ids):
             return '<div class="alert alert-danger">A player cannot play against themselves!</div>', 200
 
         # Capture after state for audit log
@@ -351,25 +360,21 @@ def update_game(game_id):
         # Commit the game update and audit log before recalculation
         db.session.commit()
 
-        # Recalculate derived data for affected seasons
-        if old_season_id == new_season.id:
-            # Game stayed in same season, just recalculate that season
-            recalculate_all_derived_data(season_id=new_season.id)
-        else:
-            # Game moved to different season, recalculate both seasons
-            recalculate_all_derived_data(season_id=old_season_id)
-            recalculate_all_derived_data(season_id=new_season.id)
-
-            # Also recalculate current season if it's different from both
-            current_season = get_current_season()
-            if current_season.id not in [old_season_id, new_season.id]:
-                recalculate_all_derived_data(season_id=current_season.id)
-
-        # Reload game to get updated relationships
-        db.session.refresh(game)
+        # Recalculate derived data for the union of affected seasons; the
+        # current season is included so player ratings stay consistent
+        affected_seasons = {old_season_id, new_season.id, get_current_season().id}
+        recalculate_all_derived_data_for_seasons(affected_seasons)
+
+        # Reload game with the relationships the row template walks in one
+        # query batch (refresh would re-fire a lazy SELECT per relationship)
+        game = db.session.get(
+            Game,
+            game_id,
+            options=[selectinload(Game.players).selectinload(GamePlayer.player)],
+        )
 
         # Get tournament game IDs for rendering
-        tournament_game_ids = {match.game_id for match in TournamentMatch.query.filter(TournamentMatch.game_id.isnot(None)).all()}
+        tournament_game_ids = _get_tournament_game_ids()
 
         # Return updated game row
         return render_template(
@@ -401,7 +406,7 @@ def cancel_edit_game(game_id):
     game = Game.query.get_or_404(game_id)
 
     # Get tournament game IDs for rendering
-    tournament_game_ids = {match.game_id for match in TournamentMatch.query.filter(TournamentMatch.game_id.isnot(None)).all()}
+    tournament_game_ids = _get_tournament_game_ids()
 
     return render_template(
         "partials/game_row.html",
@@ -1,47 +1,94 @@
 """Blueprint for leaderboard-related API routes."""
 
-from flask import Blueprint, render_template, request, jsonify
-from collections import defaultdict
+import heapq
+import time
+
+import orjson
+from flask import Blueprint, current_app, render_template, request, jsonify
+from collections import namedtuple
+from operator import itemgetter
+from sqlalchemy.orm import selectinload
 from models import db, Player, GamePlayer, Game, CakeBalance, LeaderboardHistory, Season
-from services.statistics_service import calculate_badges, precompute_badge_data
+from services.statistics_service import (
+    calculate_badges,
+    precompute_badge_data,
+    precompute_comparative_stats,
+)
+from services.elo_service import calculate_elo_change
 from services.season_service import get_current_season
+from services.cache_service import (
+    get_cached_response,
+    get_data_version,
+    make_etag,
+    set_cached_response,
+)
 
 leaderboard_bp = Blueprint("leaderboard", __name__)
 
+# Lightweight stand-in for a hydrated Player in the leaderboard rows; the
+# template and badge code only touch id, name and elo_rating
+PlayerRow = namedtuple("PlayerRow", ["id", "name", "elo_rating"])
+
+# Memoized replay results keyed by season scope; entries carry the data
+# version so any game write invalidates them implicitly
+_replay_cache = {}
+
+# Season list for the selector dropdown, cached with a short TTL: seasons
+# change at most once per quarter, and every page load hits this endpoint
+_SEASON_OPTIONS_TTL = 60  # seconds
+_season_options_cache = (0.0, None)
+
+# Chart line palette as (border, background) pairs; the background is the
+# border with an alpha suffix, concatenated once here instead of per request
+_CHART_COLORS = tuple(
+    (color, color + "33")
+    for color in (
+        "#FF6384", "#36A2EB", "#FFCE56", "#4BC0C0", "#9966FF",
+        "#FF9F40", "#FF6384", "#C9CBCF", "#4BC0C0", "#FF6384",
+    )
+)
+
+
+def _html_with_etag(body, etag):
+    """Wrap a rendered fragment in a response carrying its entity tag."""
+    response = current_app.response_class(body)
+    response.set_etag(etag)
+    return response
+
 
 def get_selected_season():
-    """Helper to get season from query params or default to current."""
+    """Helper to get season from query params or default to current.
+
+    Returns (season, season_selected, needs_replay); needs_replay is True
+    when ratings for the view must be replayed from game history instead
+    of read off Player.elo_rating (all-time and past-season views).
+    """
     season_param = request.args.get("season", "current")
 
     if season_param == "current":
-        return get_current_season(), "current"
+        return get_current_season(), "current", False
     elif season_param == "all-time":
-        return None, "all-time"  # None signals "no filter"
+        return None, "all-time", True  # None signals "no filter"
     else:
         # Specific season ID
         try:
             season_id = int(season_param)
             season = Season.query.get_or_404(season_id)
-            return season, season_id
+            return season, season_id, season.id != get_current_season().id
         except (ValueError, TypeError):
-            return get_current_season(), "current"
+            return get_current_season(), "current", False
 
 
-def calculate_season_elo_ratings(season_id):
-    """
-    Calculate ELO ratings for all players for a specific season.
-    Returns a dict mapping player_id to season ELO rating.
-    """
-    from services.elo_service import calculate_elo_change
+def _replay_elo(games):
+    """Replay a chronological list of games, returning {player_id: elo}.
 
-    # Start all players at 1500
-    player_elos = {}
-    all_players = Player.query.all()
-    for player in all_players:
-        player_elos[player.id] = 1500
-
-    # Get games for this season in chronological order
-    games = Game.query.filter_by(season_id=season_id).order_by(Game.start_time).all()
+    Shared core of the season-specific and all-time leaderboard views.
+    """
+    # Start all players at 1500; an id-only select skips hydrating Player
+    # rows just to seed the dict
+    player_elos = dict.fromkeys(
+        (pid for (pid,) in db.session.query(Player.id).all()), 1500
+    )
 
     # Replay each game
     for game in games:
@@ -55,9 +102,18 @@ def calculate_season_elo_ratings(season_id):
             else:
                 team2_players.append(gp.player_id)
 
-        # Calculate average team ratings
-        team1_avg = sum(player_elos.get(pid, 1500) for pid in team1_players) / len(team1_players)
-        team2_avg = sum(player_elos.get(pid, 1500) for pid in team2_players) / len(team2_players)
+        # Calculate average team ratings. Every player is pre-seeded at
+        # 1500, so direct indexing with a KeyError fallback beats paying
+        # the .get default check on every roster entry
+        try:
+            team1_avg = sum(player_elos[pid] for pid in team1_players) / len(team1_players)
+            team2_avg = sum(player_elos[pid] for pid in team2_players) / len(team2_players)
+        except KeyError:
+            # A player created after the seed query appeared mid-replay
+            for pid in team1_players + team2_players:
+                player_elos.setdefault(pid, 1500)
+            team1_avg = sum(player_elos[pid] for pid in team1_players) / len(team1_players)
+            team2_avg = sum(player_elos[pid] for pid in team2_players) / len(team2_players)
 
         # Calculate ELO changes
         team1_change, team2_change = calculate_elo_change(
@@ -66,82 +122,89 @@ def calculate_season_elo_ratings(season_id):
 
         # Update player ELOs
         for pid in team1_players:
-            player_elos[pid] = player_elos.get(pid, 1500) + team1_change
+            player_elos[pid] += team1_change
         for pid in team2_players:
-            player_elos[pid] = player_elos.get(pid, 1500) + team2_change
+            player_elos[pid] += team2_change
 
     return player_elos
 
 
-def calculate_alltime_elo_ratings():
+def calculate_season_elo_ratings(season_id):
     """
-    Calculate ELO ratings for all players across all games chronologically.
-    Returns a dict mapping player_id to all-time ELO rating.
+    Calculate ELO ratings for all players for a specific season.
+    Returns a dict mapping player_id to season ELO rating.
     """
-    from services.elo_service import calculate_elo_change
-
-    # Start all players at 1500
-    player_elos = {}
-    all_players = Player.query.all()
-    for player in all_players:
-        player_elos[player.id] = 1500
-
-    # Get all games in chronological order
-    games = Game.query.order_by(Game.start_time).all()
-
-    # Replay each game
-    for game in games:
-        # Get team players
-        team1_players = []
-        team2_players = []
+    version = get_data_version()
+    cached = _replay_cache.get(season_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    # Get games for this season in chronological order with rosters
+    # eager-loaded, so the replay doesn't lazy-load one query per game
+    games = (
+        Game.query.filter_by(season_id=season_id)
+        .options(selectinload(Game.players))
+        .order_by(Game.start_time)
+        .all()
+    )
 
-        for gp in game.players:
-            if gp.team == 1:
-                team1_players.append(gp.player_id)
-            else:
-                team2_players.append(gp.player_id)
+    player_elos = _replay_elo(games)
+    _replay_cache[season_id] = (version, player_elos)
+    return player_elos
 
-        # Calculate average team ratings
-        team1_avg = sum(player_elos.get(pid, 1500) for pid in team1_players) / len(team1_players)
-        team2_avg = sum(player_elos.get(pid, 1500) for pid in team2_players) / len(team2_players)
 
-        # Calculate ELO changes
-        team1_change, team2_change = calculate_elo_change(
-            team1_avg, team2_avg, game.team1_score, game.team2_score
-        )
+def calculate_alltime_elo_ratings():
+    """
+    Calculate ELO ratings for all players across all games chronologically.
+    Returns a dict mapping player_id to all-time ELO rating.
+    """
+    version = get_data_version()
+    cached = _replay_cache.get("all-time")
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
-        # Update player ELOs
-        for pid in team1_players:
-            player_elos[pid] = player_elos.get(pid, 1500) + team1_change
-        for pid in team2_players:
-            player_elos[pid] = player_elos.get(pid, 1500) + team2_change
+    # Get all games in chronological order with rosters eager-loaded
+    games = Game.query.options(selectinload(Game.players)).order_by(Game.start_time).all()
 
+    player_elos = _replay_elo(games)
+    _replay_cache["all-time"] = (version, player_elos)
     return player_elos
 
 
 @leaderboard_bp.route("/leaderboard")
 def get_leaderboard():
+    # Answer conditional polls before doing any work: if the client's tag
+    # still matches the data version, nothing can have changed
+    version = get_data_version()
+    etag = make_etag(version)
+    if etag in request.if_none_match:
+        return "", 304
+
+    cached = get_cached_response("leaderboard", version)
+    if cached is not None:
+        return _html_with_etag(cached, etag)
+
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 20, type=int)
     min_games = request.args.get("min_games", 5, type=int)  # Default to 5 games
 
     # Get selected season filter
-    season, season_selected = get_selected_season()
+    season, season_selected, needs_replay = get_selected_season()
 
     # Determine if we need to calculate ELO from scratch
     calculated_elos = None
-    current_season = get_current_season()
-
-    if season is None:  # all-time view
-        calculated_elos = calculate_alltime_elo_ratings()
-    elif season.id != current_season.id:  # past season view
-        # Calculate ELO for this specific past season
-        calculated_elos = calculate_season_elo_ratings(season.id)
+    if needs_replay:
+        if season is None:  # all-time view
+            calculated_elos = calculate_alltime_elo_ratings()
+        else:  # past season view
+            calculated_elos = calculate_season_elo_ratings(season.id)
 
     # Calculate player statistics using optimized aggregation query
     # Single query with joins to get all stats at once
     stats_query = db.session.query(
-        Player,
+        Player.id,
+        Player.name,
+        Player.elo_rating,
         db.func.count(GamePlayer.id).label('total_games'),
         db.func.sum(db.case((GamePlayer.is_winner == True, 1), else_=0)).label('wins'),
         db.func.sum(
@@ -196,10 +259,18 @@ def get_leaderboard():
 
     stats_query = stats_query.group_by(Player.id)
 
-    # Execute query and build stats list
+    # Filter by minimum games in SQL (if min_games is 0 or negative, show all)
+    if min_games > 0:
+        stats_query = stats_query.having(db.func.count(GamePlayer.id) >= min_games)
+
+    # Execute query and build stats list. The per-row branch for replayed
+    # ELO is hoisted out of the loop into a lookup callable
+    elo_lookup = calculated_elos.get if calculated_elos is not None else None
+
     players_stats = []
     for row in stats_query.all():
-        player, total_games, wins, goals_for, goals_against, shutouts_given, shutouts_received = row
+        (player_id, player_name, player_elo, total_games, wins, goals_for,
+         goals_against, shutouts_given, shutouts_received) = row
 
         # Convert to int (they come back as Decimal/long from SQL aggregates)
         total_games = int(total_games or 0)
@@ -213,14 +284,14 @@ def get_leaderboard():
         win_rate = (wins / total_games * 100) if total_games > 0 else 0
 
         # Use calculated ELO if viewing all-time or past season, otherwise use current season ELO
-        if calculated_elos is not None:
-            elo_rating = calculated_elos.get(player.id, 1500)
+        if elo_lookup is not None:
+            elo_rating = elo_lookup(player_id, 1500)
         else:
-            elo_rating = player.elo_rating
+            elo_rating = player_elo
 
         players_stats.append(
             {
-                "player": player,
+                "player": PlayerRow(player_id, player_name, player_elo),
                 "total_games": total_games,
                 "wins": wins,
                 "losses": losses,
@@ -234,30 +305,30 @@ def get_leaderboard():
             }
         )
 
-    # Sort by ELO rating (highest first)
-    players_stats.sort(key=lambda x: x["elo_rating"], reverse=True)
-
-    # Filter by minimum games (if min_games is 0 or negative, show all)
-    if min_games > 0:
-        players_stats = [p for p in players_stats if p["total_games"] >= min_games]
-
     # Pre-compute badge data for all players in one go (filtered by season)
     player_ids = [p["player"].id for p in players_stats]
     season_id_for_badges = season.id if season is not None else None
     cached_badge_data = precompute_badge_data(player_ids, season_id=season_id_for_badges)
+    cached_badge_data.update(precompute_comparative_stats(players_stats))
 
-    # Calculate badges for each player (needs all players for comparisons)
-    for player_stat in players_stats:
-        player_stat["badges"] = calculate_badges(player_stat, players_stats, cached_badge_data)
-
-    # Manual pagination
+    # Manual pagination. Ranking stays in Python because past-season and
+    # all-time views use replayed ratings that don't exist as a column, but
+    # only the top end_idx rows need ordering, so a partial heap select
+    # replaces the full sort
     total_items = len(players_stats)
     total_pages = (total_items + per_page - 1) // per_page  # Ceiling division
     start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
-    paginated_stats = players_stats[start_idx:end_idx]
+    paginated_stats = heapq.nlargest(
+        end_idx, players_stats, key=itemgetter("elo_rating")
+    )[start_idx:end_idx]
 
-    return render_template(
+    # Calculate badges only for the rendered page; the cross-player
+    # comparisons come from the precomputed data above
+    for player_stat in paginated_stats:
+        player_stat["badges"] = calculate_badges(player_stat, players_stats, cached_badge_data)
+
+    response = render_template(
         "partials/leaderboard.html",
         players_stats=paginated_stats,
         current_page=page,
@@ -266,15 +337,26 @@ def get_leaderboard():
         min_games=min_games,
         season_filter=season_selected,
     )
+    set_cached_response("leaderboard", response, version)
+    return _html_with_etag(response, etag)
 
 
 @leaderboard_bp.route("/cake-leaderboard")
 def get_cake_leaderboard():
+    version = get_data_version()
+    etag = make_etag(version)
+    if etag in request.if_none_match:
+        return "", 304
+
+    cached = get_cached_response("cake_leaderboard", version)
+    if cached is not None:
+        return _html_with_etag(cached, etag)
+
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 20, type=int)
 
     # Get selected season filter
-    season, season_selected = get_selected_season()
+    season, season_selected, _ = get_selected_season()
 
     # Get players with most cakes owed to them
     cake_stats_query = (
@@ -310,75 +392,96 @@ def get_cake_leaderboard():
         .order_by(db.func.sum(CakeBalance.balance).desc())
     )
 
-    # Calculate pagination based on the larger of the two lists
-    cake_stats_all = cake_stats_query.all()
-    debt_stats_all = debt_stats_query.all()
-    total_items = max(len(cake_stats_all), len(debt_stats_all))
+    # Calculate pagination based on the larger of the two lists using
+    # cheap distinct counts instead of materializing everything
+    creditor_count_query = db.session.query(
+        db.func.count(db.distinct(CakeBalance.creditor_id))
+    )
+    debtor_count_query = db.session.query(
+        db.func.count(db.distinct(CakeBalance.debtor_id))
+    )
+    if season is not None:
+        creditor_count_query = creditor_count_query.filter(CakeBalance.season_id == season.id)
+        debtor_count_query = debtor_count_query.filter(CakeBalance.season_id == season.id)
+
+    total_items = max(creditor_count_query.scalar(), debtor_count_query.scalar())
     total_pages = (total_items + per_page - 1) // per_page
 
-    # Paginate both lists
+    # Paginate both lists in SQL so only the page's rows are transferred
     start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    cake_stats = cake_stats_all[start_idx:end_idx]
-    debt_stats = debt_stats_all[start_idx:end_idx]
+    cake_stats = cake_stats_query.limit(per_page).offset(start_idx).all()
+    debt_stats = debt_stats_query.limit(per_page).offset(start_idx).all()
 
-    return render_template(
+    response = render_template(
         "partials/cake_leaderboard.html",
         cake_stats=cake_stats,
         debt_stats=debt_stats,
         current_page=page,
         total_pages=total_pages,
     )
+    set_cached_response("cake_leaderboard", response, version)
+    return _html_with_etag(response, etag)
 
 
 @leaderboard_bp.route("/win-rates")
 def get_win_rates():
+    cached = get_cached_response("win_rates")
+    if cached is not None:
+        return cached
+
     # Get selected season filter
-    season, season_selected = get_selected_season()
+    season, season_selected, _ = get_selected_season()
 
-    # Calculate win rates by game type for each player
-    win_rates = {}
-    players = Player.query.all()
+    # Calculate win rates by game type for each player. A single grouped
+    # aggregate replaces the two COUNT queries per (player, game type) pair.
     game_types = ["1v1", "2v2", "2v1"]
 
-    for player in players:
-        win_rates[player.name] = {}
-        for game_type in game_types:
-            # Get games for this player and game type
-            games_played_query = (
-                db.session.query(GamePlayer)
-                .join(Game)
-                .filter(GamePlayer.player_id == player.id, Game.game_type == game_type)
-            )
-
-            games_won_query = (
-                db.session.query(GamePlayer)
-                .join(Game)
-                .filter(
-                    GamePlayer.player_id == player.id,
-                    Game.game_type == game_type,
-                    GamePlayer.is_winner == True,
-                )
-            )
-
-            # Filter by season if not "all-time"
-            if season is not None:
-                games_played_query = games_played_query.filter(Game.season_id == season.id)
-                games_won_query = games_won_query.filter(Game.season_id == season.id)
-
-            games_played = games_played_query.count()
-            games_won = games_won_query.count()
+    # Zero-fill every player/game-type combination so players without games
+    # still show up in the table
+    win_rates = {
+        name: {
+            game_type: {"games_played": 0, "games_won": 0, "win_rate": 0}
+            for game_type in game_types
+        }
+        for (name,) in db.session.query(Player.name).all()
+    }
+
+    stats_query = (
+        db.session.query(
+            Player.name,
+            Game.game_type,
+            db.func.count(GamePlayer.id).label("games_played"),
+            db.func.sum(
+                db.case((GamePlayer.is_winner == True, 1), else_=0)
+            ).label("games_won"),
+        )
+        .join(GamePlayer, Player.id == GamePlayer.player_id)
+        .join(Game, GamePlayer.game_id == Game.id)
+    )
 
-            win_rate = (games_won / games_played * 100) if games_played > 0 else 0
-            win_rates[player.name][game_type] = {
-                "games_played": games_played,
-                "games_won": games_won,
-                "win_rate": win_rate,
-            }
+    # Filter by season if not "all-time"
+    if season is not None:
+        stats_query = stats_query.filter(Game.season_id == season.id)
 
-    return render_template(
+    stats_query = stats_query.group_by(Player.id, Player.name, Game.game_type)
+
+    for name, game_type, games_played, games_won in stats_query.all():
+        if game_type not in win_rates[name]:
+            continue
+        games_played = int(games_played or 0)
+        games_won = int(games_won or 0)
+        win_rate = (games_won / games_played * 100) if games_played > 0 else 0
+        win_rates[name][game_type] = {
+            "games_played": games_played,
+            "games_won": games_won,
+            "win_rate": win_rate,
+        }
+
+    response = render_template(
         "partials/win_rates.html", win_rates=win_rates, game_types=game_types
     )
+    set_cached_response("win_rates", response)
+    return response
 
 
 @leaderboard_bp.route("/leaderboard-position-chart")
@@ -387,110 +490,126 @@ def get_leaderboard_position_chart():
     Return data for leaderboard position chart showing all players' ranks over time.
     Returns JSON data for Chart.js line chart.
     """
+    cached = get_cached_response("position_chart")
+    if cached is not None:
+        return current_app.response_class(cached, mimetype="application/json")
+
     min_games = request.args.get("min_games", 5, type=int)
 
     # Get selected season filter
-    season, season_selected = get_selected_season()
+    season, season_selected, _ = get_selected_season()
 
-    # Get snapshots filtered by season, ordered by date
-    snapshots_query = LeaderboardHistory.query
+    # The x-axis covers every snapshot date in scope, taken before the
+    # min_games filter so the axis doesn't shift when players drop out
+    dates_query = db.session.query(LeaderboardHistory.snapshot_date).distinct()
 
     # Filter by season if not "all-time"
     if season is not None:
-        snapshots_query = snapshots_query.filter(LeaderboardHistory.season_id == season.id)
+        dates_query = dates_query.filter(LeaderboardHistory.season_id == season.id)
 
-    snapshots = snapshots_query.order_by(LeaderboardHistory.snapshot_date).all()
+    all_dates = sorted(d for (d,) in dates_query.all())
 
-    if not snapshots:
-        return jsonify({"dates": [], "datasets": []})
+    if not all_dates:
+        payload = orjson.dumps({"dates": [], "datasets": []})
+        set_cached_response("position_chart", payload)
+        return current_app.response_class(payload, mimetype="application/json")
 
-    # If filtering by min_games, get the set of player IDs that meet the criteria
-    filtered_player_ids = None
-    if min_games > 0:
-        filtered_player_ids = set()
-        players = Player.query.all()
-        for player in players:
-            # Count games for this player in the selected season
-            games_query = db.session.query(GamePlayer).join(Game).filter(GamePlayer.player_id == player.id)
-
-            # Filter by season if not "all-time"
-            if season is not None:
-                games_query = games_query.filter(Game.season_id == season.id)
-
-            total_games = games_query.count()
-            if total_games >= min_games:
-                filtered_player_ids.add(player.id)
-
-    # Get all unique dates (sorted)
-    all_dates = sorted(set(snapshot.snapshot_date for snapshot in snapshots))
     date_strings = [d.strftime("%Y-%m-%d") for d in all_dates]
 
-    # Group snapshots by date for recalculating ranks
-    snapshots_by_date = defaultdict(list)
-    for snapshot in snapshots:
-        if filtered_player_ids is None or snapshot.player_id in filtered_player_ids:
-            snapshots_by_date[snapshot.snapshot_date].append(snapshot)
+    # Fetch all player names once instead of lazy-loading snapshot.player
+    # per snapshot inside the rank loop
+    player_names = dict(db.session.query(Player.id, Player.name).all())
 
-    # Organize data by player with recalculated ranks
-    player_data = defaultdict(lambda: {"name": "", "ranks": [], "dates": []})
+    # If filtering by min_games, get the set of player IDs that meet the
+    # criteria with one grouped query instead of a count per player
+    filtered_player_ids = None
+    if min_games > 0:
+        counts_query = db.session.query(GamePlayer.player_id).join(Game)
 
-    for date in all_dates:
-        date_snapshots = snapshots_by_date[date]
+        # Filter by season if not "all-time"
+        if season is not None:
+            counts_query = counts_query.filter(Game.season_id == season.id)
 
-        # Sort by ELO rating (descending) to recalculate ranks
-        date_snapshots.sort(key=lambda s: s.elo_rating, reverse=True)
+        counts_query = counts_query.group_by(GamePlayer.player_id).having(
+            db.func.count(GamePlayer.id) >= min_games
+        )
+        filtered_player_ids = {pid for (pid,) in counts_query.all()}
+
+    # Recompute ranks among the filtered players with a window function —
+    # one indexed pass in the database instead of a Python sort per date.
+    # RANK() gives tied ELOs the same position
+    rank_expr = (
+        db.func.rank()
+        .over(
+            partition_by=LeaderboardHistory.snapshot_date,
+            order_by=LeaderboardHistory.elo_rating.desc(),
+        )
+        .label("rank")
+    )
+    ranks_query = db.session.query(
+        LeaderboardHistory.snapshot_date,
+        LeaderboardHistory.player_id,
+        rank_expr,
+    )
 
-        # Assign new ranks based on filtered players
-        for new_rank, snapshot in enumerate(date_snapshots, start=1):
-            player_id = snapshot.player_id
+    if season is not None:
+        ranks_query = ranks_query.filter(LeaderboardHistory.season_id == season.id)
+    if filtered_player_ids is not None:
+        ranks_query = ranks_query.filter(
+            LeaderboardHistory.player_id.in_(filtered_player_ids)
+        )
 
-            if not player_data[player_id]["name"]:
-                player_data[player_id]["name"] = snapshot.player.name
+    # Organize data by player, writing straight into a preallocated
+    # per-player rank list (None where the player has no snapshot that day)
+    date_index = {d: i for i, d in enumerate(all_dates)}
+    num_dates = len(date_strings)
+    player_data = {}
+
+    for snapshot_date, player_id, rank in ranks_query.all():
+        data = player_data.get(player_id)
+        if data is None:
+            data = player_data[player_id] = {
+                "name": player_names[player_id],
+                "ranks": [None] * num_dates,
+            }
 
-            player_data[player_id]["dates"].append(date.strftime("%Y-%m-%d"))
-            player_data[player_id]["ranks"].append(new_rank)
+        data["ranks"][date_index[snapshot_date]] = rank
 
     # Build datasets for each player
-    datasets = []
-    colors = [
-        "#FF6384", "#36A2EB", "#FFCE56", "#4BC0C0", "#9966FF",
-        "#FF9F40", "#FF6384", "#C9CBCF", "#4BC0C0", "#FF6384"
-    ]
-
-    for idx, (player_id, data) in enumerate(player_data.items()):
-        # Create a date-to-rank mapping for this player
-        date_rank_map = dict(zip(data["dates"], data["ranks"]))
-
-        # Fill in ranks for all dates (null if player didn't have data that day)
-        ranks_by_date = []
-        for date_str in date_strings:
-            ranks_by_date.append(date_rank_map.get(date_str, None))
-
-        datasets.append({
+    datasets = [
+        {
             "label": data["name"],
-            "data": ranks_by_date,
-            "borderColor": colors[idx % len(colors)],
-            "backgroundColor": colors[idx % len(colors)] + "33",  # Add transparency
+            "data": data["ranks"],
+            "borderColor": _CHART_COLORS[idx % len(_CHART_COLORS)][0],
+            "backgroundColor": _CHART_COLORS[idx % len(_CHART_COLORS)][1],
             "tension": 0.1,
             "spanGaps": True  # Connect lines even with null values
-        })
+        }
+        for idx, data in enumerate(player_data.values())
+    ]
 
-    return jsonify({
-        "dates": date_strings,
-        "datasets": datasets
-    })
+    # orjson serializes the large dates x players payload considerably
+    # faster than the stdlib encoder behind jsonify
+    payload = orjson.dumps({"dates": date_strings, "datasets": datasets})
+    set_cached_response("position_chart", payload)
+    return current_app.response_class(payload, mimetype="application/json")
 
 
 @leaderboard_bp.route("/season-options")
 def get_season_options():
     """Return all available seasons for selector dropdown."""
-    current_season = get_current_season()
-    all_seasons = Season.query.order_by(Season.start_date.desc()).all()
+    global _season_options_cache
 
-    return jsonify({
-        "current_season_id": current_season.id,
-        "seasons": [
+    cached_at, seasons = _season_options_cache
+    if seasons is None or time.monotonic() - cached_at > _SEASON_OPTIONS_TTL:
+        seasons = [
             {"id": s.id, "name": s.name, "is_current": s.is_current}
-            for s in all_seasons
+            for s in Season.query.order_by(Season.start_date.desc()).all()
         ]
+        _season_options_cache = (time.monotonic(), seasons)
+
+    current_season = get_current_season()
+    return jsonify({
+        "current_season_id": current_season.id,
+        "seasons": seasons,
     })
@@ -1,34 +1,49 @@
 """Blueprint for page routes (non-API routes that return full HTML pages)."""
 
-from flask import Blueprint, render_template
+from flask import Blueprint, current_app, render_template
 from models import Player, Tournament
 
 pages_bp = Blueprint("pages", __name__)
 
+# Page shells carry no dynamic context (all data arrives via htmx), so
+# each one is rendered once per process and served from memory after that.
+# Debug mode bypasses the cache so template edits show up immediately.
+_page_cache = {}
+
+
+def _render_page(template_name):
+    if current_app.debug:
+        return render_template(template_name)
+    page = _page_cache.get(template_name)
+    if page is None:
+        page = render_template(template_name)
+        _page_cache[template_name] = page
+    return page
+
 
 @pages_bp.route("/")
 def index():
-    return render_template("index.html")
+    return _render_page("index.html")
 
 
 @pages_bp.route("/players")
 def players():
-    return render_template("players.html")
+    return _render_page("players.html")
 
 
 @pages_bp.route("/games")
 def games():
-    return render_template("games.html")
+    return _render_page("games.html")
 
 
 @pages_bp.route("/leaderboard")
 def leaderboard():
-    return render_template("leaderboard.html")
+    return _render_page("leaderboard.html")
 
 
 @pages_bp.route("/statistics")
 def statistics():
-    return render_template("statistics.html")
+    return _render_page("statistics.html")
 
 
 @pages_bp.route("/players/<int:player_id>")
@@ -39,7 +54,7 @@ def player_detail(player_id):
 
 @pages_bp.route("/tournaments")
 def tournaments():
-    return render_template("tournaments.html")
+    return _render_page("tournaments.html")
 
 
 @pages_bp.route("/tournaments/<int:tournament_id>")
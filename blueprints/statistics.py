@@ -1,10 +1,12 @@
 """Blueprint for statistics and chart-related API routes."""
 
-from flask import Blueprint, render_template, request, jsonify
+import orjson
+from flask import Blueprint, current_app, render_template, request
 from datetime import datetime, timedelta
-from collections import defaultdict
+from sqlalchemy.orm import selectinload
 from models import db, Player, Game, GamePlayer, CakeBalance, LeaderboardHistory, Season
 from services.season_service import get_current_season
+from services.cache_service import make_etag
 
 statistics_bp = Blueprint("statistics", __name__)
 
@@ -28,26 +30,44 @@ def get_selected_season():
 
 @statistics_bp.route("/quick-stats")
 def get_quick_stats():
+    # Answer conditional polls cheaply: if the client's tag still matches
+    # the data version, skip the aggregates and the render entirely
+    etag = make_etag()
+    if etag in request.if_none_match:
+        return "", 304
+
     # Get selected season filter
     season, season_selected = get_selected_season()
 
     total_players = Player.query.count()
 
-    # Filter games by season
-    games_query = Game.query
+    # Count games and shutouts in one aggregate instead of loading every
+    # game just to evaluate is_shutout in Python
+    counts_query = db.session.query(
+        db.func.count(Game.id),
+        db.func.sum(
+            db.case(
+                (db.func.abs(Game.team1_score - Game.team2_score) >= 10, 1),
+                else_=0,
+            )
+        ),
+    )
     if season is not None:
-        games_query = games_query.filter(Game.season_id == season.id)
+        counts_query = counts_query.filter(Game.season_id == season.id)
 
-    total_games = games_query.count()
-    all_games = games_query.all()
-    total_shutouts = sum(1 for game in all_games if game.is_shutout)
+    total_games, total_shutouts = counts_query.first()
+    total_shutouts = int(total_shutouts or 0)
 
     stats = {
         "total_players": total_players,
         "total_games": total_games,
         "total_shutouts": total_shutouts,
     }
-    return render_template("partials/quick_stats.html", stats=stats)
+    response = current_app.response_class(
+        render_template("partials/quick_stats.html", stats=stats)
+    )
+    response.set_etag(etag)
+    return response
 
 
 @statistics_bp.route("/detailed-stats")
@@ -56,15 +76,17 @@ def get_detailed_stats():
     total_games = Game.query.count()
     total_players = Player.query.count()
 
-    # Calculate average game duration
-    games_with_duration = Game.query.filter(
-        Game.start_time.isnot(None), Game.end_time.isnot(None)
-    ).all()
-    avg_duration = None
-    if games_with_duration:
-        avg_duration = sum(g.duration_minutes for g in games_with_duration) / len(
-            games_with_duration
-        )
+    # Calculate average game duration in SQL instead of hydrating every
+    # timed game; mirrors the duration expression in get_chart_data
+    duration_minutes_expr = db.func.cast(
+        (db.func.julianday(Game.end_time) - db.func.julianday(Game.start_time)) * 1440,
+        db.Integer,
+    )
+    avg_duration = (
+        db.session.query(db.func.avg(duration_minutes_expr))
+        .filter(Game.start_time.isnot(None), Game.end_time.isnot(None))
+        .scalar()
+    )
 
     # Most active players
     most_active = (
@@ -121,18 +143,19 @@ def get_detailed_stats():
 
 @statistics_bp.route("/chart-data")
 def get_chart_data():
-    # Games over time data
-    games = Game.query.order_by(Game.start_time).all()
-    games_by_date = defaultdict(int)
+    # Games over time: bucket per day in SQL for the 30-day window instead
+    # of loading every game into Python
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=30)
 
-    # Group games by date
-    for game in games:
-        date_key = game.start_time.strftime("%Y-%m-%d")
-        games_by_date[date_key] += 1
+    games_by_date = dict(
+        db.session.query(db.func.date(Game.start_time), db.func.count(Game.id))
+        .filter(db.func.date(Game.start_time) >= start_date.strftime("%Y-%m-%d"))
+        .group_by(db.func.date(Game.start_time))
+        .all()
+    )
 
     # Fill in missing dates for the last 30 days
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=30)
     dates = []
     games_per_day = []
 
@@ -143,47 +166,65 @@ def get_chart_data():
         games_per_day.append(games_by_date.get(date_key, 0))
         current_date += timedelta(days=1)
 
-    # Game duration data
-    duration_data = defaultdict(list)
-    for game in games:
-        if game.duration_minutes:
-            duration_data[game.game_type].append(game.duration_minutes)
+    # Average duration per game type. The cast mirrors duration_minutes,
+    # which truncates each game to whole minutes before averaging
+    duration_minutes_expr = db.func.cast(
+        (db.func.julianday(Game.end_time) - db.func.julianday(Game.start_time)) * 1440,
+        db.Integer,
+    )
+    durations_by_type = {
+        game_type: avg_duration
+        for game_type, avg_duration in db.session.query(
+            Game.game_type, db.func.avg(duration_minutes_expr)
+        )
+        .filter(Game.end_time.isnot(None), duration_minutes_expr >= 1)
+        .group_by(Game.game_type)
+        .all()
+    }
 
     duration_labels = []
     average_durations = []
     for game_type in ["1v1", "2v2", "2v1"]:
-        if duration_data[game_type]:
+        if game_type in durations_by_type:
             duration_labels.append(game_type)
-            avg_duration = sum(duration_data[game_type]) / len(duration_data[game_type])
-            average_durations.append(round(avg_duration, 1))
+            average_durations.append(round(durations_by_type[game_type], 1))
 
     # Game types distribution
-    game_type_counts = defaultdict(int)
-    for game in games:
-        game_type_counts[game.game_type] += 1
+    game_type_rows = (
+        db.session.query(Game.game_type, db.func.count(Game.id))
+        .group_by(Game.game_type)
+        .all()
+    )
+
+    # Player performance data from one grouped aggregate instead of two
+    # count queries per player
+    player_rows = (
+        db.session.query(
+            Player.name,
+            db.func.count(GamePlayer.id),
+            db.func.sum(db.case((GamePlayer.is_winner == True, 1), else_=0)),
+        )
+        .join(GamePlayer, GamePlayer.player_id == Player.id)
+        .group_by(Player.id, Player.name)
+        .order_by(Player.id)
+        .all()
+    )
 
-    # Player performance data
-    players = Player.query.all()
     player_names = []
     win_rates = []
-
-    for player in players:
-        total_games = GamePlayer.query.filter_by(player_id=player.id).count()
+    for name, total_games, wins in player_rows:
+        total_games = int(total_games or 0)
         if total_games > 0:
-            wins = GamePlayer.query.filter_by(
-                player_id=player.id, is_winner=True
-            ).count()
-            win_rate = wins / total_games * 100
-            player_names.append(player.name)
-            win_rates.append(round(win_rate, 1))
+            player_names.append(name)
+            win_rates.append(round(int(wins or 0) / total_games * 100, 1))
 
     chart_data = {
         "dates": dates,
         "games_per_day": games_per_day,
         "duration_labels": duration_labels,
         "average_durations": average_durations,
-        "game_types": list(game_type_counts.keys()),
-        "game_type_counts": list(game_type_counts.values()),
+        "game_types": [game_type for game_type, _ in game_type_rows],
+        "game_type_counts": [count for _, count in game_type_rows],
         "player_names": player_names,
         "win_rates": win_rates,
     }
@@ -195,61 +236,81 @@ def get_chart_data():
 def get_player_stats(player_id):
     player = Player.query.get_or_404(player_id)
 
-    # Calculate player statistics
-    total_games = GamePlayer.query.filter_by(player_id=player.id).count()
-    wins = GamePlayer.query.filter_by(player_id=player.id, is_winner=True).count()
-    losses = total_games - wins
+    # Calculate player statistics with one aggregate over the player's
+    # games, mirroring the CASE sums the leaderboard query uses, instead
+    # of count queries plus two Python loops over lazy-loaded rows
+    shutout_condition = db.or_(
+        Game.team1_score - Game.team2_score >= 10,
+        Game.team2_score - Game.team1_score >= 10,
+    )
+    totals = (
+        db.session.query(
+            db.func.count(GamePlayer.id),
+            db.func.sum(db.case((GamePlayer.is_winner == True, 1), else_=0)),
+            db.func.sum(
+                db.case(
+                    (GamePlayer.team == 1, Game.team1_score),
+                    else_=Game.team2_score,
+                )
+            ),
+            db.func.sum(
+                db.case(
+                    (GamePlayer.team == 1, Game.team2_score),
+                    else_=Game.team1_score,
+                )
+            ),
+            db.func.sum(
+                db.case(
+                    (db.and_(shutout_condition, GamePlayer.is_winner == True), 1),
+                    else_=0,
+                )
+            ),
+            db.func.sum(
+                db.case(
+                    (db.and_(shutout_condition, GamePlayer.is_winner == False), 1),
+                    else_=0,
+                )
+            ),
+        )
+        .join(Game, GamePlayer.game_id == Game.id)
+        .filter(GamePlayer.player_id == player.id)
+        .first()
+    )
+
+    total_games = int(totals[0] or 0)
+    wins = int(totals[1] or 0)
+    goals_for = int(totals[2] or 0)
+    goals_against = int(totals[3] or 0)
+    shutouts_given = int(totals[4] or 0)
+    shutouts_received = int(totals[5] or 0)
 
+    losses = total_games - wins
     win_rate = (wins / total_games * 100) if total_games > 0 else 0
 
-    # Calculate goals scored and conceded
-    goals_for = 0
-    goals_against = 0
-
-    for gp in GamePlayer.query.filter_by(player_id=player.id).all():
-        game = gp.game
-        if gp.team == 1:
-            goals_for += game.team1_score
-            goals_against += game.team2_score
-        else:
-            goals_for += game.team2_score
-            goals_against += game.team1_score
-
-    # Calculate shutouts given and received
-    shutouts_given = 0
-    shutouts_received = 0
-
-    for gp in GamePlayer.query.filter_by(player_id=player.id).all():
-        game = gp.game
-        if game.is_shutout:
-            if gp.is_winner:
-                shutouts_given += 1
-            else:
-                shutouts_received += 1
-
-    # Calculate win rates by game type
+    # Calculate win rates by game type with one grouped query
     game_types = ["1v1", "2v2", "2v1"]
-    win_rates_by_type = {}
-
-    for game_type in game_types:
-        games_played = (
-            db.session.query(GamePlayer)
-            .join(Game)
-            .filter(GamePlayer.player_id == player.id, Game.game_type == game_type)
-            .count()
-        )
+    win_rates_by_type = {
+        game_type: {"games_played": 0, "games_won": 0, "win_rate": 0}
+        for game_type in game_types
+    }
 
-        games_won = (
-            db.session.query(GamePlayer)
-            .join(Game)
-            .filter(
-                GamePlayer.player_id == player.id,
-                Game.game_type == game_type,
-                GamePlayer.is_winner == True,
-            )
-            .count()
+    by_type = (
+        db.session.query(
+            Game.game_type,
+            db.func.count(GamePlayer.id),
+            db.func.sum(db.case((GamePlayer.is_winner == True, 1), else_=0)),
         )
+        .join(GamePlayer, GamePlayer.game_id == Game.id)
+        .filter(GamePlayer.player_id == player.id)
+        .group_by(Game.game_type)
+        .all()
+    )
 
+    for game_type, games_played, games_won in by_type:
+        if game_type not in win_rates_by_type:
+            continue
+        games_played = int(games_played or 0)
+        games_won = int(games_won or 0)
         win_rate_type = (games_won / games_played * 100) if games_played > 0 else 0
         win_rates_by_type[game_type] = {
             "games_played": games_played,
@@ -257,20 +318,23 @@ def get_player_stats(player_id):
             "win_rate": win_rate_type,
         }
 
-    # Calculate cake balance
-    cakes_owed_to_player = (
-        db.session.query(db.func.sum(CakeBalance.balance))
-        .filter(CakeBalance.creditor_id == player.id)
-        .scalar()
-        or 0
-    )
+    # Calculate cake balance in both roles with a single pass
+    cake_totals = db.session.query(
+        db.func.sum(
+            db.case((CakeBalance.creditor_id == player.id, CakeBalance.balance), else_=0)
+        ),
+        db.func.sum(
+            db.case((CakeBalance.debtor_id == player.id, CakeBalance.balance), else_=0)
+        ),
+    ).filter(
+        db.or_(
+            CakeBalance.creditor_id == player.id,
+            CakeBalance.debtor_id == player.id,
+        )
+    ).first()
 
-    cakes_player_owes = (
-        db.session.query(db.func.sum(CakeBalance.balance))
-        .filter(CakeBalance.debtor_id == player.id)
-        .scalar()
-        or 0
-    )
+    cakes_owed_to_player = int(cake_totals[0] or 0)
+    cakes_player_owes = int(cake_totals[1] or 0)
 
     stats = {
         "player": player,
@@ -300,19 +364,22 @@ def get_player_games(player_id):
 
     player = Player.query.get_or_404(player_id)
 
-    # Get all games this player participated in
-    game_players = GamePlayer.query.filter_by(player_id=player.id).all()
-    games = [gp.game for gp in game_players]
-
-    # Sort by most recent first
-    games.sort(key=lambda x: x.start_time, reverse=True)
+    # Get this player's games sorted and paginated in SQL; rosters are
+    # eager-loaded for the template
+    games_query = (
+        Game.query.join(GamePlayer, GamePlayer.game_id == Game.id)
+        .filter(GamePlayer.player_id == player.id)
+        .order_by(Game.start_time.desc())
+    )
 
-    # Manual pagination
-    total_items = len(games)
+    total_items = games_query.count()
     total_pages = (total_items + per_page - 1) // per_page
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    paginated_games = games[start_idx:end_idx]
+    paginated_games = (
+        games_query.options(selectinload(Game.players).selectinload(GamePlayer.player))
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+        .all()
+    )
 
     return render_template(
         "partials/player_games.html",
@@ -336,21 +403,12 @@ def get_player_position_history(player_id):
         player_id=player_id
     ).order_by(LeaderboardHistory.snapshot_date).all()
 
-    if not snapshots:
-        return jsonify({
-            "dates": [],
-            "ranks": [],
-            "elo_ratings": [],
-            "player_name": player.name
-        })
-
-    dates = [s.snapshot_date.strftime("%Y-%m-%d") for s in snapshots]
-    ranks = [s.rank for s in snapshots]
-    elo_ratings = [s.elo_rating for s in snapshots]
-
-    return jsonify({
-        "dates": dates,
-        "ranks": ranks,
-        "elo_ratings": elo_ratings,
+    # orjson serializes the snapshot arrays faster than jsonify and emits
+    # dates in ISO format natively, so no per-row strftime is needed
+    payload = orjson.dumps({
+        "dates": [s.snapshot_date for s in snapshots],
+        "ranks": [s.rank for s in snapshots],
+        "elo_ratings": [s.elo_rating for s in snapshots],
         "player_name": player.name
     })
+    return current_app.response_class(payload, mimetype="application/json")
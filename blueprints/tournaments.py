@@ -1,19 +1,70 @@
 """Blueprint for tournament-related routes and API."""
 
+import hashlib
+import time
+
+from collections import defaultdict
 from flask import Blueprint, render_template, request, url_for, make_response
 from datetime import datetime, timezone
-from models import db, Player, Game, GamePlayer, Tournament, TournamentMatch
+from sqlalchemy.orm import joinedload
+from models import db, Player, Game, GamePlayer, Tournament, TournamentMatch, TournamentStatus
 from services.tournament_service import generate_tournament_bracket, advance_winner
 from services.elo_service import update_elo_ratings
 from services.leaderboard_service import create_daily_snapshot
+from services.background_service import run_in_background
+from services.season_service import get_season_for_date
 
 tournaments_bp = Blueprint("tournaments", __name__)
 
+# Rendered tournaments-list pages keyed by (page, per_page). Tournaments
+# change only on create or match record, so the write paths clear this
+# explicitly; the short TTL is a safety net for multi-process setups
+_TOURNAMENTS_TTL = 30  # seconds
+_tournaments_cache = {}
+
+
+def _get_bracket_matches(tournament_id):
+    """Load a tournament's matches with every relationship the bracket
+    template dereferences, so rendering issues no per-match queries."""
+    return (
+        TournamentMatch.query.options(
+            joinedload(TournamentMatch.player1),
+            joinedload(TournamentMatch.player2),
+            joinedload(TournamentMatch.winner),
+            joinedload(TournamentMatch.game),
+        )
+        .filter_by(tournament_id=tournament_id)
+        .order_by(TournamentMatch.round_number.desc(), TournamentMatch.match_number)
+        .all()
+    )
+
+
+def _render_bracket(tournament, matches):
+    """Render the bracket partial from an already-loaded match list."""
+    rounds = defaultdict(list)
+    for match in matches:
+        rounds[match.round_number].append(match)
+
+    return render_template(
+        "partials/tournament_bracket.html",
+        tournament=tournament,
+        rounds=rounds,
+        # Matches arrive ordered by round_number DESC, so the first row
+        # already carries the highest round
+        max_round=matches[0].round_number if matches else 0
+    )
+
 
 # Tournament API Routes
 @tournaments_bp.route("/api/tournaments/players/select", methods=["GET"])
 def get_tournament_players():
-    players = Player.query.order_by(Player.elo_rating.desc()).all()
+    # The selection list only shows id, name and rating — select those
+    # columns directly instead of hydrating full Player objects
+    players = (
+        db.session.query(Player.id, Player.name, Player.elo_rating)
+        .order_by(Player.elo_rating.desc())
+        .all()
+    )
     return render_template("partials/player_selection.html", players=players)
 
 
@@ -22,16 +73,22 @@ def get_tournaments():
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
 
+    entry = _tournaments_cache.get((page, per_page))
+    if entry is not None and time.monotonic() - entry[0] < _TOURNAMENTS_TTL:
+        return entry[1]
+
     pagination = Tournament.query.order_by(Tournament.created_at.desc()).paginate(
         page=page, per_page=per_page, error_out=False
     )
 
-    return render_template(
+    response = render_template(
         "partials/tournaments_list.html",
         tournaments=pagination.items,
         current_page=pagination.page,
         total_pages=pagination.pages,
     )
+    _tournaments_cache[(page, per_page)] = (time.monotonic(), response)
+    return response
 
 
 @tournaments_bp.route("/api/tournaments", methods=["POST"])
@@ -50,7 +107,14 @@ def create_tournament():
     except ValueError:
         return "<div class='alert alert-danger'>Invalid player selection</div>"
 
-    tournament = Tournament(name=name, status="setup")
+    # Create the tournament active from the start: nothing observes the
+    # intermediate setup state, and a failed bracket rolls everything back,
+    # so this saves an UPDATE on the freshly inserted row
+    tournament = Tournament(
+        name=name,
+        status=TournamentStatus.ACTIVE,
+        started_at=datetime.now(timezone.utc),
+    )
     db.session.add(tournament)
     db.session.flush()
 
@@ -59,9 +123,8 @@ def create_tournament():
         db.session.rollback()
         return "<div class='alert alert-danger'>Failed to generate tournament bracket</div>"
 
-    tournament.status = "active"
-    tournament.started_at = datetime.now(timezone.utc)
     db.session.commit()
+    _tournaments_cache.clear()
 
     # Return redirect instruction for htmx
     response = make_response("")
@@ -72,23 +135,29 @@ def create_tournament():
 @tournaments_bp.route("/api/tournaments/<int:tournament_id>/bracket")
 def get_tournament_bracket(tournament_id):
     tournament = Tournament.query.get_or_404(tournament_id)
-    matches = TournamentMatch.query.filter_by(tournament_id=tournament_id).order_by(
-        TournamentMatch.round_number.desc(), TournamentMatch.match_number
-    ).all()
-
-    # Group matches by round
-    rounds = {}
-    for match in matches:
-        if match.round_number not in rounds:
-            rounds[match.round_number] = []
-        rounds[match.round_number].append(match)
 
-    return render_template(
-        "partials/tournament_bracket.html",
-        tournament=tournament,
-        rounds=rounds,
-        max_round=max(rounds.keys()) if rounds else 0
+    # The bracket only changes when a match is recorded, so a cheap
+    # signature over recorded winners stands in for a missing updated_at;
+    # matching If-None-Match polls skip the match query and the render
+    recorded, last_game_id = (
+        db.session.query(
+            db.func.count(TournamentMatch.winner_id),
+            db.func.max(TournamentMatch.game_id),
+        )
+        .filter(TournamentMatch.tournament_id == tournament_id)
+        .first()
     )
+    etag = hashlib.blake2b(
+        f"{tournament_id}:{tournament.status}:{recorded}:{last_game_id}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    if etag in request.if_none_match:
+        return "", 304
+
+    matches = _get_bracket_matches(tournament_id)
+    response = make_response(_render_bracket(tournament, matches))
+    response.set_etag(etag)
+    return response
 
 
 @tournaments_bp.route("/api/tournaments/<int:tournament_id>/matches/<int:match_id>/form", methods=["GET"])
@@ -147,12 +216,19 @@ def record_tournament_match(tournament_id, match_id):
     # Determine winner based on score
     winner_id = match.player1_id if team1_score > team2_score else match.player2_id
 
-    # Create the actual game record
+    # One timestamp per request: the game's start and a potential
+    # completion below then agree within the same transaction
+    now = datetime.now(timezone.utc)
+
+    # Create the actual game record, assigned to the season covering now
+    # just like regular game recording
+    season = get_season_for_date(now)
     game = Game(
+        season_id=season.id,
         game_type="1v1",
         team1_score=team1_score,
         team2_score=team2_score,
-        start_time=datetime.now(timezone.utc)
+        start_time=now
     )
     db.session.add(game)
     db.session.flush()
@@ -183,46 +259,25 @@ def record_tournament_match(tournament_id, match_id):
     # Advance winner to next round
     advance_winner(match)
 
-    # Commit the transaction first to ensure all changes are saved
-    db.session.commit()
-
-    # Create daily snapshot after committing the game
-    try:
-        create_daily_snapshot()
-    except Exception as snapshot_error:
-        # Log error but don't fail the tournament match creation
-        print(f"Warning: Failed to create daily snapshot: {snapshot_error}")
-
-    # Check if tournament is complete (must be after commit)
-    finals = TournamentMatch.query.filter_by(
-        tournament_id=tournament_id, round_number=1
-    ).first()
+    # Flush so the bracket reload below sees the recorded match, then
+    # decide completion before the single commit — one fsync per request
+    db.session.flush()
+    matches = _get_bracket_matches(tournament_id)
 
+    finals = next((m for m in matches if m.round_number == 1), None)
     if finals and finals.winner_id and finals.game_id:
         # Finals has been played and has a winner - tournament is complete
-        tournament.status = "completed"
-        tournament.completed_at = datetime.now(timezone.utc)
-        db.session.commit()
-
-    # Return updated bracket HTML directly (not a redirect)
-    matches = TournamentMatch.query.filter_by(tournament_id=tournament_id).order_by(
-        TournamentMatch.round_number.desc(), TournamentMatch.match_number
-    ).all()
-
-    # Group matches by round
-    rounds = {}
-    for match_obj in matches:
-        if match_obj.round_number not in rounds:
-            rounds[match_obj.round_number] = []
-        rounds[match_obj.round_number].append(match_obj)
+        tournament.status = TournamentStatus.COMPLETED
+        tournament.completed_at = now
+
+    db.session.commit()
+    _tournaments_cache.clear()
+
+    # Update the daily snapshot off the request path, matching add_game
+    run_in_background(create_daily_snapshot, season_id=game.season_id)
 
     # On success, return bracket with headers to target the bracket container
-    response = make_response(render_template(
-        "partials/tournament_bracket.html",
-        tournament=tournament,
-        rounds=rounds,
-        max_round=max(rounds.keys()) if rounds else 0
-    ))
+    response = make_response(_render_bracket(tournament, matches))
     response.headers['HX-Retarget'] = '#tournament-bracket'
     response.headers['HX-Reswap'] = 'innerHTML'
     return response
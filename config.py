@@ -5,8 +5,16 @@ import secrets
 class Config:
     """Application configuration."""
 
-    SECRET_KEY = secrets.token_hex(32)
+    # Prefer a stable key from the environment; a generated fallback keeps
+    # local dev working but invalidates sessions on every restart
+    SECRET_KEY = os.environ.get("SECRET_KEY") or secrets.token_hex(32)
     SQLALCHEMY_DATABASE_URI = os.environ.get(
         "DATABASE_PATH", "sqlite:///foosball.db"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Filesystem cache for compiled Jinja templates, shared across workers
+    # and restarts so each process skips the parse/compile step. Defaults
+    # to a directory under the instance path (resolved in create_app) —
+    # the cache is loaded with marshal, so it must not live somewhere a
+    # world-writable path lets other local users plant files
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get("JINJA_BYTECODE_CACHE_DIR")
@@ -5,6 +5,8 @@ Revises: a1b2c3d4e5f6
 Create Date: 2026-02-13 16:30:00.000000
 
 """
+from calendar import monthrange
+
 from alembic import op
 import sqlalchemy as sa
 
@@ -29,8 +31,12 @@ def upgrade():
         sa.UniqueConstraint('name')
     )
 
-    # Create index on is_current for fast current season lookup
-    op.create_index('ix_season_is_current', 'season', ['is_current'], unique=False)
+    # Partial unique index on is_current: indexes only the single current
+    # row (fast lookup) and guarantees at most one season is current
+    op.create_index(
+        'uq_season_one_current', 'season', ['is_current'],
+        unique=True, sqlite_where=sa.text('is_current = 1')
+    )
 
     # Step 2: Add season_id columns (nullable initially)
     with op.batch_alter_table('game', schema=None) as batch_op:
@@ -73,21 +79,8 @@ def upgrade():
         # Helper function to get quarter boundaries
         def get_quarter_boundaries(year, quarter):
             start_month = (quarter - 1) * 3 + 1
-            if quarter == 4:
-                end_month = 12
-                end_day = 31
-            else:
-                end_month = start_month + 2
-                if end_month == 3:
-                    # February
-                    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-                        end_day = 29
-                    else:
-                        end_day = 28
-                elif end_month in [1, 3, 5, 7, 8, 10, 12]:
-                    end_day = 31
-                else:
-                    end_day = 30
+            end_month = start_month + 2
+            end_day = monthrange(year, end_month)[1]
 
             start_date = f"{year}-{start_month:02d}-01 00:00:00"
             end_date = f"{year}-{end_month:02d}-{end_day} 23:59:59"
@@ -103,30 +96,38 @@ def upgrade():
         # Determine which season should be current (the one containing max_date)
         current_season_name = f"Q{end_quarter} {end_year}"
 
+        # Collect every quarter's row first, then insert them in a single
+        # executemany instead of one round-trip per quarter
+        season_rows = []
         while (current_year < end_year) or (current_year == end_year and current_quarter <= end_quarter):
             season_name = f"Q{current_quarter} {current_year}"
             start_date, end_date = get_quarter_boundaries(current_year, current_quarter)
-            is_current = 1 if season_name == current_season_name else 0
-
-            op.execute(
-                sa.text(
-                    """
-                    INSERT INTO season (name, start_date, end_date, is_current, created_at)
-                    VALUES (:name, :start_date, :end_date, :is_current, datetime('now'))
-                    """
-                ).bindparams(
-                    name=season_name,
-                    start_date=start_date,
-                    end_date=end_date,
-                    is_current=is_current
-                )
-            )
+
+            season_rows.append({
+                "name": season_name,
+                "start_date": start_date,
+                "end_date": end_date,
+                "is_current": 1 if season_name == current_season_name else 0,
+            })
 
             # Move to next quarter
             current_quarter += 1
             if current_quarter > 4:
                 current_quarter = 1
                 current_year += 1
+
+        conn.execute(
+            sa.text(
+                """
+                INSERT INTO season (name, start_date, end_date, is_current, created_at)
+                VALUES (:name, :start_date, :end_date, :is_current, datetime('now'))
+                """
+            ),
+            season_rows,
+        )
+        # executemany cannot RETURNING, so the current season's id is
+        # re-selected below only on this branch
+        current_season_id = None
     else:
         # No games exist, create current quarter as default
         from datetime import datetime
@@ -136,15 +137,8 @@ def upgrade():
 
         def get_quarter_boundaries(year, quarter):
             start_month = (quarter - 1) * 3 + 1
-            if quarter == 4:
-                end_month = 12
-                end_day = 31
-            else:
-                end_month = start_month + 2
-                if end_month in [1, 3, 5, 7, 8, 10, 12]:
-                    end_day = 31
-                else:
-                    end_day = 30
+            end_month = start_month + 2
+            end_day = monthrange(year, end_month)[1]
 
             start_date = f"{year}-{start_month:02d}-01 00:00:00"
             end_date = f"{year}-{end_month:02d}-{end_day} 23:59:59"
@@ -153,61 +147,57 @@ def upgrade():
         season_name = f"Q{quarter} {year}"
         start_date, end_date = get_quarter_boundaries(year, quarter)
 
-        op.execute(
+        # RETURNING hands back the new id directly, avoiding the re-select
+        row = conn.execute(
             sa.text(
                 """
                 INSERT INTO season (name, start_date, end_date, is_current, created_at)
                 VALUES (:name, :start_date, :end_date, 1, datetime('now'))
+                RETURNING id
                 """
-            ).bindparams(
-                name=season_name,
-                start_date=start_date,
-                end_date=end_date
-            )
-        )
-
-    # Step 4: Assign games to correct seasons based on their start_time
-    # For each season, update games that fall within its date range
-    seasons = conn.execute(sa.text("SELECT id, start_date, end_date FROM season"))
-    for season_id, start_date, end_date in seasons:
-        op.execute(
-            sa.text(
-                """
-                UPDATE game
-                SET season_id = :season_id
-                WHERE start_time >= :start_date AND start_time <= :end_date
-                """
-            ).bindparams(
-                season_id=season_id,
-                start_date=start_date,
-                end_date=end_date
+            ),
+            {"name": season_name, "start_date": start_date, "end_date": end_date},
+        ).fetchone()
+        current_season_id = row[0]
+
+    # Step 4: Assign games to correct seasons based on their start_time.
+    # A single correlated UPDATE replaces the per-season UPDATE loop:
+    # seasons never overlap, so the subquery yields exactly one id
+    op.execute(
+        sa.text(
+            """
+            UPDATE game
+            SET season_id = (
+                SELECT s.id FROM season s
+                WHERE game.start_time >= s.start_date AND game.start_time <= s.end_date
             )
+            """
         )
+    )
 
     # Assign leaderboard_history to seasons based on snapshot_date
-    seasons = conn.execute(sa.text("SELECT id, start_date, end_date FROM season"))
-    for season_id, start_date, end_date in seasons:
-        op.execute(
-            sa.text(
-                """
-                UPDATE leaderboard_history
-                SET season_id = :season_id
-                WHERE snapshot_date >= date(:start_date) AND snapshot_date <= date(:end_date)
-                """
-            ).bindparams(
-                season_id=season_id,
-                start_date=start_date,
-                end_date=end_date
+    op.execute(
+        sa.text(
+            """
+            UPDATE leaderboard_history
+            SET season_id = (
+                SELECT s.id FROM season s
+                WHERE leaderboard_history.snapshot_date >= date(s.start_date)
+                  AND leaderboard_history.snapshot_date <= date(s.end_date)
             )
+            """
         )
+    )
 
     # For cake_balance, assign to the most recent season (since they don't have dates)
     # This will be recalculated properly when games are processed
-    current_season = conn.execute(sa.text("SELECT id FROM season WHERE is_current = 1")).fetchone()
-    if current_season:
+    if current_season_id is None:
+        row = conn.execute(sa.text("SELECT id FROM season WHERE is_current = 1")).fetchone()
+        current_season_id = row[0] if row else None
+    if current_season_id is not None:
         op.execute(
             sa.text("UPDATE cake_balance SET season_id = :season_id").bindparams(
-                season_id=current_season[0]
+                season_id=current_season_id
             )
         )
 
@@ -265,5 +255,5 @@ def downgrade():
         batch_op.drop_column('season_id')
 
     # Drop season table
-    op.drop_index('ix_season_is_current', table_name='season')
+    op.drop_index('uq_season_one_current', table_name='season')
     op.drop_table('season')
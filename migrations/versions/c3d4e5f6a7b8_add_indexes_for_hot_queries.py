@@ -0,0 +1,33 @@
+"""Add indexes for hot queries
+
+Revision ID: c3d4e5f6a7b8
+Revises: b1c2d3e4f5g6
+Create Date: 2026-02-14 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d4e5f6a7b8'
+down_revision = 'b1c2d3e4f5g6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Covers the win/loss aggregate in the leaderboard query
+    op.create_index(
+        'ix_game_player_player_winner', 'game_player', ['player_id', 'is_winner'], unique=False
+    )
+    # Covers ORDER BY start_time in games pagination and recent-games
+    op.create_index('ix_game_start_time', 'game', ['start_time'], unique=False)
+    # Covers the tournament-game lookups when rendering the games list
+    op.create_index('ix_tournament_match_game_id', 'tournament_match', ['game_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tournament_match_game_id', table_name='tournament_match')
+    op.drop_index('ix_game_start_time', table_name='game')
+    op.drop_index('ix_game_player_player_winner', table_name='game_player')
@@ -0,0 +1,37 @@
+"""Add composite indexes for season-scoped aggregates
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-03-02 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e5f6a7b8c9'
+down_revision = 'c3d4e5f6a7b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Season-scoped game scans ordered by start_time (leaderboard replay,
+    # charts, recent-games) no longer need a separate sort step
+    op.create_index('ix_game_season_start_time', 'game', ['season_id', 'start_time'], unique=False)
+    # Covers the players-of-a-game lookup grouped by team
+    op.create_index('ix_game_player_game_team', 'game_player', ['game_id', 'team'], unique=False)
+    # Cake leaderboard groups by creditor/debtor within a season
+    op.create_index('ix_cake_balance_season_creditor', 'cake_balance', ['season_id', 'creditor_id'], unique=False)
+    op.create_index('ix_cake_balance_season_debtor', 'cake_balance', ['season_id', 'debtor_id'], unique=False)
+    # Position chart filters snapshots by season and date
+    op.create_index('ix_leaderboard_history_season_date', 'leaderboard_history', ['season_id', 'snapshot_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_leaderboard_history_season_date', table_name='leaderboard_history')
+    op.drop_index('ix_cake_balance_season_debtor', table_name='cake_balance')
+    op.drop_index('ix_cake_balance_season_creditor', table_name='cake_balance')
+    op.drop_index('ix_game_player_game_team', table_name='game_player')
+    op.drop_index('ix_game_season_start_time', table_name='game')
@@ -0,0 +1,32 @@
+"""Add indexes for bracket rendering and winner lookups
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-03-09 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5f6a7b8c9d0'
+down_revision = 'd4e5f6a7b8c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Bracket renders run WHERE tournament_id=? ORDER BY round_number,
+    # match_number; this index returns the rows pre-sorted
+    op.create_index(
+        'ix_tournament_match_bracket', 'tournament_match',
+        ['tournament_id', 'round_number', 'match_number'], unique=False
+    )
+    # Winner-advancement lookups filter on winner_id
+    op.create_index('ix_tournament_match_winner_id', 'tournament_match', ['winner_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tournament_match_winner_id', table_name='tournament_match')
+    op.drop_index('ix_tournament_match_bracket', table_name='tournament_match')
@@ -9,9 +9,21 @@ class Season(db.Model):
     name = db.Column(db.String(50), nullable=False, unique=True)  # "Q1 2025"
     start_date = db.Column(db.DateTime, nullable=False)
     end_date = db.Column(db.DateTime, nullable=False)
-    is_current = db.Column(db.Boolean, default=False, index=True)
+    is_current = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Partial unique index: only the is_current=1 row is indexed, so the
+    # current-season lookup is a one-row hit and a second current season
+    # can never be committed
+    __table_args__ = (
+        db.Index(
+            "uq_season_one_current",
+            "is_current",
+            unique=True,
+            sqlite_where=db.text("is_current = 1"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Season {self.name}>"
 
@@ -29,7 +41,7 @@ class Player(db.Model):
 class Game(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     season_id = db.Column(db.Integer, db.ForeignKey("season.id"), nullable=False, index=True)
-    start_time = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    start_time = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
     end_time = db.Column(db.DateTime)
     game_type = db.Column(db.String(10), nullable=False)  # '1v1', '2v2', '2v1'
     team1_score = db.Column(db.Integer, nullable=False)
@@ -51,6 +63,10 @@ class Game(db.Model):
     def is_shutout(self):
         return abs(self.team1_score - self.team2_score) >= 10
 
+    __table_args__ = (
+        db.Index("ix_game_season_start_time", "season_id", "start_time"),
+    )
+
     def __repr__(self):
         return f"<Game {self.team1_score}-{self.team2_score} ({self.game_type})>"
 
@@ -66,6 +82,11 @@ class GamePlayer(db.Model):
     game = db.relationship("Game", back_populates="players")
     player = db.relationship("Player")
 
+    __table_args__ = (
+        db.Index("ix_game_player_player_winner", "player_id", "is_winner"),
+        db.Index("ix_game_player_game_team", "game_id", "team"),
+    )
+
     def __repr__(self):
         return f"<GamePlayer {self.player.name} Team{self.team}>"
 
@@ -81,6 +102,11 @@ class CakeBalance(db.Model):
     debtor = db.relationship("Player", foreign_keys=[debtor_id])
     creditor = db.relationship("Player", foreign_keys=[creditor_id])
 
+    __table_args__ = (
+        db.Index("ix_cake_balance_season_creditor", "season_id", "creditor_id"),
+        db.Index("ix_cake_balance_season_debtor", "season_id", "debtor_id"),
+    )
+
     def __repr__(self):
         return f"<CakeBalance {self.debtor.name} owes {self.creditor.name}: {self.balance}>"
 
@@ -99,19 +125,28 @@ class LeaderboardHistory(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint("player_id", "season_id", "snapshot_date", name="unique_player_season_date"),
+        db.Index("ix_leaderboard_history_season_date", "season_id", "snapshot_date"),
     )
 
     def __repr__(self):
         return f"<LeaderboardHistory {self.player.name} rank {self.rank} on {self.snapshot_date}>"
 
 
+class TournamentStatus:
+    """Valid values for Tournament.status."""
+
+    SETUP = "setup"
+    ACTIVE = "active"
+    COMPLETED = "completed"
+
+
 class Tournament(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     started_at = db.Column(db.DateTime)
     completed_at = db.Column(db.DateTime)
-    status = db.Column(db.String(20), default="setup")  # 'setup', 'active', 'completed'
+    status = db.Column(db.String(20), default=TournamentStatus.SETUP)
 
     matches = db.relationship("TournamentMatch", back_populates="tournament", cascade="all, delete-orphan")
     participants = db.relationship("TournamentParticipant", back_populates="tournament", cascade="all, delete-orphan")
@@ -142,7 +177,7 @@ class TournamentMatch(db.Model):
     player1_id = db.Column(db.Integer, db.ForeignKey("player.id"), nullable=True)  # Null if TBD
     player2_id = db.Column(db.Integer, db.ForeignKey("player.id"), nullable=True)  # Null if TBD
     winner_id = db.Column(db.Integer, db.ForeignKey("player.id"), nullable=True)
-    game_id = db.Column(db.Integer, db.ForeignKey("game.id"), nullable=True)  # Link to actual game played
+    game_id = db.Column(db.Integer, db.ForeignKey("game.id"), nullable=True, index=True)  # Link to actual game played
     next_match_id = db.Column(db.Integer, db.ForeignKey("tournament_match.id"), nullable=True)  # Winner advances to this match
 
     tournament = db.relationship("Tournament", back_populates="matches")
@@ -152,6 +187,11 @@ class TournamentMatch(db.Model):
     game = db.relationship("Game")
     next_match = db.relationship("TournamentMatch", remote_side=[id], foreign_keys=[next_match_id])
 
+    __table_args__ = (
+        db.Index("ix_tournament_match_bracket", "tournament_id", "round_number", "match_number"),
+        db.Index("ix_tournament_match_winner_id", "winner_id"),
+    )
+
     def __repr__(self):
         return f"<TournamentMatch R{self.round_number}M{self.match_number}>"
 
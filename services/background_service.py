@@ -0,0 +1,36 @@
+"""Helper for running deferred work outside the request/response cycle."""
+
+import threading
+from flask import current_app
+
+# Deferred tasks all touch the same derived tables (e.g. the daily
+# leaderboard snapshot), so run them one at a time: two snapshot threads
+# racing the same day's rows trip the unique constraint and lose a write
+_task_lock = threading.Lock()
+
+
+def run_in_background(func, *args, **kwargs):
+    """Run a function in a daemon thread with its own application context.
+
+    Used to move non-critical derived-data updates (e.g. daily leaderboard
+    snapshots) off the request path so POST handlers can return as soon as
+    the game itself is committed. Errors are logged, not raised, matching
+    the previous inline behavior.
+
+    Args:
+        func: The function to execute
+        *args: Positional arguments passed to func
+        **kwargs: Keyword arguments passed to func
+    """
+    app = current_app._get_current_object()
+
+    def _runner():
+        with app.app_context(), _task_lock:
+            try:
+                func(*args, **kwargs)
+            except Exception as error:
+                print(f"Warning: Background task {func.__name__} failed: {error}")
+
+    thread = threading.Thread(target=_runner, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,78 @@
+"""In-process response cache for read-mostly htmx endpoints.
+
+Entries are keyed on an endpoint name plus the request's query string and
+stamped with a cheap data version derived from the game and player tables,
+so adding, editing or deleting a game (or adding a player) invalidates
+every cached response implicitly — no explicit cache busting in the write
+paths.
+"""
+
+import hashlib
+
+from flask import request
+from models import db, Game, GameAuditLog, LeaderboardHistory, Player, Season
+
+_cache = {}
+
+
+def get_data_version():
+    """Return a cheap stamp that changes whenever the underlying data does.
+
+    Each table is aggregated in its own query — combining them in one
+    SELECT would cross-join the tables, and an empty audit log then wipes
+    out the game aggregates entirely. Leaderboard history is included so
+    background snapshot writes invalidate the position-chart cache, and the
+    current season's id is included because a quarter rollover changes what
+    the leaderboard shows without touching the game or player aggregates.
+    """
+    game_version = db.session.query(
+        db.func.max(Game.id), db.func.count(Game.id)
+    ).first()
+    audit_version = db.session.query(db.func.max(GameAuditLog.id)).first()
+    player_version = db.session.query(
+        db.func.max(Player.id), db.func.count(Player.id)
+    ).first()
+    history_version = db.session.query(
+        db.func.max(LeaderboardHistory.id), db.func.count(LeaderboardHistory.id)
+    ).first()
+    season_version = db.session.query(
+        db.func.max(Season.id),
+        db.func.max(db.case((Season.is_current, Season.id))),
+    ).first()
+    return (
+        *game_version,
+        *audit_version,
+        *player_version,
+        *history_version,
+        *season_version,
+    )
+
+
+def make_etag(version=None):
+    """Entity tag for the current data version.
+
+    Lets hot GET endpoints answer If-None-Match probes with 304 before
+    running any aggregates or rendering.
+    """
+    if version is None:
+        version = get_data_version()
+    return hashlib.blake2b(repr(version).encode(), digest_size=8).hexdigest()
+
+
+def get_cached_response(name, version=None):
+    """Return the cached response for this request, or None on a miss."""
+    entry = _cache.get((name, request.query_string))
+    if entry is None:
+        return None
+    if version is None:
+        version = get_data_version()
+    if entry[0] != version:
+        return None
+    return entry[1]
+
+
+def set_cached_response(name, response, version=None):
+    """Cache a response under this request's query string."""
+    if version is None:
+        version = get_data_version()
+    _cache[(name, request.query_string)] = (version, response)
@@ -1,5 +1,7 @@
 """ELO rating calculation and management service."""
 
+from sqlalchemy.orm import selectinload
+
 from models import db, Player, Game, GamePlayer
 
 
@@ -19,9 +21,10 @@ def calculate_elo_change(
     Returns:
         Tuple of (team1_change, team2_change)
     """
-    # Calculate expected scores
+    # Calculate expected scores; the two probabilities are complementary,
+    # so one exponentiation covers both teams
     expected_team1 = 1 / (1 + 10 ** ((team2_rating - team1_rating) / 400))
-    expected_team2 = 1 / (1 + 10 ** ((team1_rating - team2_rating) / 400))
+    expected_team2 = 1 - expected_team1
 
     # Actual scores (1 for win, 0 for loss)
     actual_team1 = 1 if team1_score > team2_score else 0
@@ -45,7 +48,7 @@ def update_elo_ratings(game):
     team2_game_players = []
 
     for gp in game.players:
-        player = Player.query.get(gp.player_id)
+        player = gp.player
         if gp.team == 1:
             team1_players.append(player)
             team1_game_players.append(gp)
@@ -83,20 +86,42 @@ def recalculate_all_elo_ratings(season_id=None):
 
     This is useful for initializing ELO ratings or fixing inconsistencies.
     """
-    # Reset all player ratings to 1500
-    players = Player.query.all()
-    for player in players:
-        player.elo_rating = 1500
+    # Replay on plain dicts instead of mutating tracked Player objects:
+    # the ORM would otherwise re-flush every player touched by every game.
+    # Seeding from the full roster doubles as the reset to 1500
+    player_elos = dict.fromkeys(
+        (pid for (pid,) in db.session.query(Player.id).all()), 1500
+    )
 
-    # Get games in chronological order, optionally filtered by season
-    query = Game.query.order_by(Game.start_time)
+    # Get games in chronological order with rosters preloaded, so the
+    # replay loop never lazy-loads per game
+    query = Game.query.options(selectinload(Game.players)).order_by(Game.start_time)
     if season_id is not None:
         query = query.filter_by(season_id=season_id)
 
-    games = query.all()
-
-    # Replay each game to update ELO ratings
-    for game in games:
-        update_elo_ratings(game)
-
+    gp_changes = []
+    for game in query.yield_per(500):
+        team1 = [gp for gp in game.players if gp.team == 1]
+        team2 = [gp for gp in game.players if gp.team != 1]
+
+        team1_avg = sum(player_elos[gp.player_id] for gp in team1) / len(team1)
+        team2_avg = sum(player_elos[gp.player_id] for gp in team2) / len(team2)
+
+        team1_change, team2_change = calculate_elo_change(
+            team1_avg, team2_avg, game.team1_score, game.team2_score
+        )
+
+        for gp in team1:
+            player_elos[gp.player_id] += team1_change
+            gp_changes.append({"id": gp.id, "elo_change": team1_change})
+        for gp in team2:
+            player_elos[gp.player_id] += team2_change
+            gp_changes.append({"id": gp.id, "elo_change": team2_change})
+
+    # Two bulk batches write everything back in place of per-row flushes
+    db.session.bulk_update_mappings(
+        Player,
+        [{"id": pid, "elo_rating": elo} for pid, elo in player_elos.items()],
+    )
+    db.session.bulk_update_mappings(GamePlayer, gp_changes)
     db.session.commit()
@@ -87,7 +87,9 @@ def create_game_audit_entry(game, before_data, after_data, editor_ip):
     audit_log = GameAuditLog(
         game_id=game.id,
         editor_ip=editor_ip,
-        changes=json.dumps(changes),
+        # Compact separators: audit rows are write-only on the edit path,
+        # so skip the whitespace padding
+        changes=json.dumps(changes, separators=(",", ":")),
         summary=summary
     )
 
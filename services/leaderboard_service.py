@@ -1,7 +1,8 @@
 """Leaderboard calculation and historical snapshot service."""
 
 from datetime import date, timedelta
-from collections import defaultdict
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from models import db, Player, GamePlayer, LeaderboardHistory, Game
 from services.elo_service import calculate_elo_change
 
@@ -18,6 +19,17 @@ def create_daily_snapshot(season_id, snapshot_date=None):
     if snapshot_date is None:
         snapshot_date = date.today()
 
+    try:
+        _write_daily_snapshot(season_id, snapshot_date)
+    except IntegrityError:
+        # A concurrent writer inserted the same day's rows between our
+        # existence check and commit; on retry they exist and get updated
+        db.session.rollback()
+        _write_daily_snapshot(season_id, snapshot_date)
+
+
+def _write_daily_snapshot(season_id, snapshot_date):
+    """Build and commit the snapshot rows for one season and day."""
     # Calculate current leaderboard statistics
     players_stats = []
     players = Player.query.all()
@@ -90,62 +102,15 @@ def recalculate_historical_snapshots(season_id=None):
     player_elo = {player.id: 1500 for player in players}
     player_games_count = {player.id: 0 for player in players}
 
-    # Get games in chronological order, optionally filtered by season
-    query = Game.query.order_by(Game.start_time)
+    # Stream games in chronological order, optionally filtered by season.
+    # Eager-load the rosters so the replay doesn't lazy-load per game;
+    # yield_per keeps memory bounded instead of materializing every game
+    query = Game.query.options(selectinload(Game.players)).order_by(Game.start_time)
     if season_id is not None:
         query = query.filter_by(season_id=season_id)
 
-    games = query.all()
-
-    if not games:
-        db.session.commit()
-        return
-
-    # Group games by date and season
-    games_by_date = defaultdict(list)
-    for game in games:
-        game_date = game.start_time.date()
-        games_by_date[game_date].append(game)
-
-    # Process games chronologically by date
-    sorted_dates = sorted(games_by_date.keys())
-
-    for game_date in sorted_dates:
-        # Process all games for this date
-        for game in games_by_date[game_date]:
-            # Get team players
-            team1_players = []
-            team2_players = []
-
-            for gp in game.players:
-                if gp.team == 1:
-                    team1_players.append(gp.player_id)
-                else:
-                    team2_players.append(gp.player_id)
-
-                # Increment games count
-                player_games_count[gp.player_id] = player_games_count.get(gp.player_id, 0) + 1
-
-            # Calculate average team ratings
-            team1_avg_rating = sum(player_elo[pid] for pid in team1_players) / len(team1_players)
-            team2_avg_rating = sum(player_elo[pid] for pid in team2_players) / len(team2_players)
-
-            # Calculate ELO changes
-            team1_change, team2_change = calculate_elo_change(
-                team1_avg_rating, team2_avg_rating, game.team1_score, game.team2_score
-            )
-
-            # Update player ELO ratings in memory
-            for pid in team1_players:
-                player_elo[pid] += team1_change
-
-            for pid in team2_players:
-                player_elo[pid] += team2_change
-
-        # Create snapshot for this date (after all games for the day)
-        # Use the season_id from the first game on this date
-        snapshot_season_id = games_by_date[game_date][0].season_id if season_id is None else season_id
-
+    def snapshot_day(game_date, snapshot_season_id):
+        """Store the ranked snapshot for a finished day."""
         players_stats = []
         for player_id, elo_rating in player_elo.items():
             games_count = player_games_count.get(player_id, 0)
@@ -159,7 +124,6 @@ def recalculate_historical_snapshots(season_id=None):
         # Sort by ELO to determine ranks
         players_stats.sort(key=lambda x: x["elo_rating"], reverse=True)
 
-        # Store snapshots
         for rank, player_stat in enumerate(players_stats, start=1):
             snapshot = LeaderboardHistory(
                 player_id=player_stat["player_id"],
@@ -171,4 +135,50 @@ def recalculate_historical_snapshots(season_id=None):
             )
             db.session.add(snapshot)
 
+    # Games arrive ordered by start_time, so days complete sequentially:
+    # snapshot each day as soon as the next one begins
+    current_date = None
+    current_day_season_id = None
+
+    for game in query.yield_per(500):
+        game_date = game.start_time.date()
+        if game_date != current_date:
+            if current_date is not None:
+                snapshot_day(current_date, current_day_season_id)
+            current_date = game_date
+            # Use the season_id from the first game on this date
+            current_day_season_id = game.season_id if season_id is None else season_id
+
+        # Get team players
+        team1_players = []
+        team2_players = []
+
+        for gp in game.players:
+            if gp.team == 1:
+                team1_players.append(gp.player_id)
+            else:
+                team2_players.append(gp.player_id)
+
+            # Increment games count (dict is prepopulated for all players)
+            player_games_count[gp.player_id] += 1
+
+        # Calculate average team ratings
+        team1_avg_rating = sum(player_elo[pid] for pid in team1_players) / len(team1_players)
+        team2_avg_rating = sum(player_elo[pid] for pid in team2_players) / len(team2_players)
+
+        # Calculate ELO changes
+        team1_change, team2_change = calculate_elo_change(
+            team1_avg_rating, team2_avg_rating, game.team1_score, game.team2_score
+        )
+
+        # Update player ELO ratings in memory
+        for pid in team1_players:
+            player_elo[pid] += team1_change
+
+        for pid in team2_players:
+            player_elo[pid] += team2_change
+
+    if current_date is not None:
+        snapshot_day(current_date, current_day_season_id)
+
     db.session.commit()
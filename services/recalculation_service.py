@@ -49,3 +49,30 @@ def recalculate_all_derived_data(season_id=None):
     recalculate_historical_snapshots(season_id=season_id)
 
     db.session.commit()
+
+
+def recalculate_all_derived_data_for_seasons(season_ids):
+    """
+    Recalculate derived data for a set of affected seasons in one call.
+
+    The ELO replay is path-dependent per season, so each season still gets
+    its own pass — but the current season is always replayed last so that
+    Player.elo_rating ends up reflecting the current season even when a
+    game edit touched a past one.
+
+    Args:
+        season_ids: Iterable of season IDs to recalculate.
+    """
+    from services.season_service import get_current_season
+
+    season_ids = set(season_ids)
+    if not season_ids:
+        return
+
+    current_id = get_current_season().id
+    ordered = sorted(season_ids - {current_id})
+    if current_id in season_ids:
+        ordered.append(current_id)
+
+    for season_id in ordered:
+        recalculate_all_derived_data(season_id=season_id)
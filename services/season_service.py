@@ -1,4 +1,7 @@
+from calendar import monthrange
 from datetime import datetime, timedelta
+from functools import lru_cache
+from flask import g
 from models import db, Season, Player
 
 
@@ -33,15 +36,8 @@ def get_quarter_boundaries(year, quarter):
         raise ValueError("Quarter must be between 1 and 4")
 
     start_month = (quarter - 1) * 3 + 1
-    if quarter == 4:
-        end_month = 12
-        end_day = 31
-    else:
-        end_month = start_month + 2
-        if end_month in [1, 3, 5, 7, 8, 10, 12]:
-            end_day = 31
-        else:
-            end_day = 30
+    end_month = start_month + 2
+    end_day = monthrange(year, end_month)[1]
 
     start_date = datetime(year, start_month, 1, 0, 0, 0)
     end_date = datetime(year, end_month, end_day, 23, 59, 59)
@@ -85,9 +81,21 @@ def get_current_season():
     If the current date is past the current season's end_date, automatically
     transitions to the next quarter's season.
 
+    Memoized on flask.g, so repeated calls within one request (or app
+    context) resolve the season from the database only once.
+
     Returns:
         Season: The current season
     """
+    season = getattr(g, "_current_season", None)
+    if season is None:
+        season = _load_current_season()
+        g._current_season = season
+    return season
+
+
+def _load_current_season():
+    """Resolve (or create) the current season from the database."""
     now = datetime.utcnow()
 
     # Try to get the current season
@@ -135,6 +143,27 @@ def transition_to_season(season):
     db.session.commit()
 
 
+@lru_cache(maxsize=64)
+def _season_id_for_day(year, month, day):
+    """Resolve (and create if needed) the season covering a calendar day.
+
+    Cached on the day so repeated game writes within the same quarter
+    skip the date-range SELECT. Only the ID is cached — season rows are
+    never deleted, so the ID stays valid across sessions.
+    """
+    date = datetime(year, month, day)
+    season = Season.query.filter(
+        Season.start_date <= date,
+        Season.end_date >= date
+    ).first()
+
+    if season is None:
+        quarter, season_year = get_quarter_info(date)
+        season = create_season(season_year, quarter)
+
+    return season.id
+
+
 def get_season_for_date(date):
     """
     Returns the season that contains the given date.
@@ -146,15 +175,5 @@ def get_season_for_date(date):
     Returns:
         Season: The season containing this date
     """
-    # Find existing season that contains this date
-    season = Season.query.filter(
-        Season.start_date <= date,
-        Season.end_date >= date
-    ).first()
-
-    if season:
-        return season
-
-    # No season found, create one for this date's quarter
-    quarter, year = get_quarter_info(date)
-    return create_season(year, quarter)
+    season_id = _season_id_for_day(date.year, date.month, date.day)
+    return db.session.get(Season, season_id)
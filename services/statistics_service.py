@@ -1,5 +1,6 @@
 """Statistics calculation service including streaks and badges."""
 
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import func, or_
 from models import db, GamePlayer, Game, CakeBalance
@@ -65,9 +66,41 @@ def precompute_badge_data(player_ids, season_id=None):
         'addict': set()
     }
 
-    # Bulk compute streaks for all players
+    # Bulk compute streaks for all players from one ordered result set
+    # instead of a per-player query
+    outcomes_query = (
+        db.session.query(GamePlayer.player_id, GamePlayer.is_winner)
+        .join(Game)
+        .filter(GamePlayer.player_id.in_(player_ids))
+        .order_by(Game.start_time.asc())
+    )
+
+    if season_id is not None:
+        outcomes_query = outcomes_query.filter(Game.season_id == season_id)
+
+    outcomes_by_player = defaultdict(list)
+    for player_id, is_winner in outcomes_query.all():
+        outcomes_by_player[player_id].append(is_winner)
+
     for player_id in player_ids:
-        cached_data['streaks'][player_id] = calculate_player_streaks(player_id, season_id=season_id)
+        outcomes = outcomes_by_player.get(player_id)
+        if not outcomes:
+            cached_data['streaks'][player_id] = (0, 0)
+            continue
+
+        best_streak = 0
+        temp_streak = 0
+        for is_winner in outcomes:
+            if is_winner:
+                temp_streak += 1
+                if temp_streak > best_streak:
+                    best_streak = temp_streak
+            else:
+                temp_streak = 0
+
+        # Current streak only counts if the last game was a win
+        current_streak = temp_streak if outcomes[-1] else 0
+        cached_data['streaks'][player_id] = (current_streak, best_streak)
 
     # Bulk query cake totals
     cake_query = db.session.query(
@@ -90,6 +123,9 @@ def precompute_badge_data(player_ids, season_id=None):
         if player_id not in cached_data['cake_totals']:
             cached_data['cake_totals'][player_id] = 0
 
+    # Hoist the Cake King comparison out of the per-player badge loop
+    cached_data['max_cakes'] = max(cached_data['cake_totals'].values(), default=0)
+
     # Bulk query recent games (last 7 days)
     seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
     recent_query = db.session.query(
@@ -115,6 +151,9 @@ def precompute_badge_data(player_ids, season_id=None):
         if player_id not in cached_data['recent_games']:
             cached_data['recent_games'][player_id] = 0
 
+    # Hoist the Marathon comparison out of the per-player badge loop
+    cached_data['max_recent_games'] = max(cached_data['recent_games'].values(), default=0)
+
     # Compute Night Owl badge (played between 8pm and 6am)
     night_owl_query = db.session.query(GamePlayer.player_id).join(
         Game, GamePlayer.game_id == Game.id
@@ -267,6 +306,39 @@ def precompute_badge_data(player_ids, season_id=None):
     return cached_data
 
 
+def precompute_comparative_stats(all_players_stats):
+    """Pre-compute the cross-player comparison values used by calculate_badges.
+
+    Without this, every calculate_badges call re-scans the full stats list to
+    find the qualifying maxima, making the badge loop O(N^2) in player count.
+
+    Args:
+        all_players_stats: List of all player stats dictionaries
+
+    Returns:
+        Dictionary with keys 'max_goals_per_game' and 'max_survivor_shutouts'
+        (None when no player qualifies for the respective comparison)
+    """
+    max_goals_per_game = max(
+        (p["goals_for"] / p["total_games"] for p in all_players_stats if p["total_games"] >= 20),
+        default=None
+    )
+
+    max_survivor_shutouts = max(
+        (
+            p["shutouts_received"]
+            for p in all_players_stats
+            if p["shutouts_received"] >= 3 and p["win_rate"] > 50 and p["total_games"] >= 10
+        ),
+        default=None
+    )
+
+    return {
+        'max_goals_per_game': max_goals_per_game,
+        'max_survivor_shutouts': max_survivor_shutouts,
+    }
+
+
 def calculate_badges(player_stats, all_players_stats, cached_data=None):
     """Calculate achievement badges for a player based on their stats.
 
@@ -311,13 +383,15 @@ def calculate_badges(player_stats, all_players_stats, cached_data=None):
     if player_stats["total_games"] >= 20:
         goals_per_game = player_stats["goals_for"] / player_stats["total_games"]
         # Check if this is the highest goals per game among qualified players
-        qualified_players = [p for p in all_players_stats if p["total_games"] >= 20]
-        if qualified_players:
+        if 'max_goals_per_game' in cached_data:
+            max_goals_per_game = cached_data['max_goals_per_game']
+        else:
             max_goals_per_game = max(
-                p["goals_for"] / p["total_games"] for p in qualified_players
+                (p["goals_for"] / p["total_games"] for p in all_players_stats if p["total_games"] >= 20),
+                default=None
             )
-            if goals_per_game == max_goals_per_game and goals_per_game > 0:
-                badges.append({"emoji": "🎯", "label": "Sharpshooter", "color": "info", "tooltip": f"Highest goals per game average: {goals_per_game:.1f}"})
+        if max_goals_per_game is not None and goals_per_game == max_goals_per_game and goals_per_game > 0:
+            badges.append({"emoji": "🎯", "label": "Sharpshooter", "color": "info", "tooltip": f"Highest goals per game average: {goals_per_game:.1f}"})
 
     # Shutout Achievements
     if player_stats["shutouts_given"] >= 5:
@@ -326,7 +400,9 @@ def calculate_badges(player_stats, all_players_stats, cached_data=None):
     # Cake King (most cakes owed to them)
     if 'cake_totals' in cached_data:
         total_cakes = cached_data['cake_totals'].get(player.id, 0)
-        all_cake_totals = list(cached_data['cake_totals'].values())
+        max_cakes = cached_data.get('max_cakes')
+        if max_cakes is None:
+            max_cakes = max(cached_data['cake_totals'].values(), default=0)
     else:
         cake_query = (
             db.session.query(db.func.sum(CakeBalance.balance))
@@ -343,8 +419,9 @@ def calculate_badges(player_stats, all_players_stats, cached_data=None):
                 .scalar() or 0
             )
             all_cake_totals.append(p_cakes)
+        max_cakes = max(all_cake_totals) if all_cake_totals else 0
 
-    if total_cakes > 0 and all_cake_totals and total_cakes == max(all_cake_totals):
+    if total_cakes > 0 and total_cakes == max_cakes:
         badges.append({"emoji": "🎂", "label": "Cake King", "color": "light", "tooltip": f"Most cakes owed by opponents: {total_cakes} cake{'s' if total_cakes != 1 else ''}"})
 
     # Survivor (most shutouts received but still positive win rate)
@@ -353,17 +430,21 @@ def calculate_badges(player_stats, all_players_stats, cached_data=None):
         and player_stats["win_rate"] > 50
         and player_stats["total_games"] >= 10
     ):
-        qualified_survivors = [
-            p
-            for p in all_players_stats
-            if p["shutouts_received"] >= 3
-            and p["win_rate"] > 50
-            and p["total_games"] >= 10
-        ]
-        if qualified_survivors:
-            max_shutouts_received = max(p["shutouts_received"] for p in qualified_survivors)
-            if player_stats["shutouts_received"] == max_shutouts_received:
-                badges.append({"emoji": "💪", "label": "Survivor", "color": "success", "tooltip": f"Survived {player_stats['shutouts_received']} shutouts but still winning ({player_stats['win_rate']:.1f}% win rate)"})
+        if 'max_survivor_shutouts' in cached_data:
+            max_shutouts_received = cached_data['max_survivor_shutouts']
+        else:
+            max_shutouts_received = max(
+                (
+                    p["shutouts_received"]
+                    for p in all_players_stats
+                    if p["shutouts_received"] >= 3
+                    and p["win_rate"] > 50
+                    and p["total_games"] >= 10
+                ),
+                default=None
+            )
+        if player_stats["shutouts_received"] == max_shutouts_received:
+            badges.append({"emoji": "💪", "label": "Survivor", "color": "success", "tooltip": f"Survived {player_stats['shutouts_received']} shutouts but still winning ({player_stats['win_rate']:.1f}% win rate)"})
 
     # Activity Badges
     if player_stats["total_games"] >= 50:
@@ -372,7 +453,9 @@ def calculate_badges(player_stats, all_players_stats, cached_data=None):
     # Marathon (most games in last 7 days, min 5)
     if 'recent_games' in cached_data:
         recent_games = cached_data['recent_games'].get(player.id, 0)
-        all_recent_games = list(cached_data['recent_games'].values())
+        max_recent_games = cached_data.get('max_recent_games')
+        if max_recent_games is None:
+            max_recent_games = max(cached_data['recent_games'].values(), default=0)
     else:
         seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
         recent_games = (
@@ -391,8 +474,9 @@ def calculate_badges(player_stats, all_players_stats, cached_data=None):
                 .count()
             )
             all_recent_games.append(p_recent)
+        max_recent_games = max(all_recent_games) if all_recent_games else 0
 
-    if recent_games >= 5 and all_recent_games and recent_games == max(all_recent_games):
+    if recent_games >= 5 and recent_games == max_recent_games:
         badges.append({"emoji": "📈", "label": "Marathon", "color": "info", "tooltip": f"Most active player: {recent_games} games in the last 7 days"})
 
     # Night Owl badge (played between 8pm and 6am)